@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 
 import numpy as np
@@ -16,6 +17,28 @@ class Shapes:
     k_instr: int
 
 
+def _all_finite(arr: np.ndarray) -> bool:
+    """
+    Check finiteness with a single reduction; scan elementwise only on failure.
+
+    A finite sum implies every entry is finite (NaN/inf propagate), so the
+    boolean mask is only materialized when the sum is non-finite, which may
+    also be caused by overflow of large finite values.
+    """
+    with np.errstate(over="ignore", invalid="ignore"):
+        total = arr.sum()
+    return bool(np.isfinite(total)) or bool(np.isfinite(arr).all())
+
+
+def _as_scalar_float(x: float | Sequence[float] | np.ndarray) -> float:
+    """
+    First element of x as a Python float; plain numbers skip the array wrap.
+    """
+    if isinstance(x, (float, int)):
+        return float(x)
+    return float(np.asarray(x, dtype=np.float64).ravel()[0])
+
+
 def _as_2d_float(x: np.ndarray, *, name: str) -> FloatArray:
     arr = np.asarray(x, dtype=np.float64)
     if arr.ndim == 1:
@@ -24,7 +47,7 @@ def _as_2d_float(x: np.ndarray, *, name: str) -> FloatArray:
         raise ValueError(f"{name} must be 1D or 2D; got shape {arr.shape}.")
     if arr.size == 0:
         raise ValueError(f"{name} must be non-empty.")
-    if not np.isfinite(arr).all():
+    if not _all_finite(arr):
         raise ValueError(f"{name} contains NaN or infinite values.")
     return arr
 
@@ -35,9 +58,11 @@ def _as_1d_int(x: np.ndarray, *, name: str) -> IntArray:
         raise ValueError(f"{name} must be 1D; got shape {arr.shape}.")
     if arr.size == 0:
         raise ValueError(f"{name} must be non-empty.")
-    if not np.isfinite(arr.astype(np.float64)).all():
+    if not np.issubdtype(arr.dtype, np.integer) and not _all_finite(
+        arr.astype(np.float64)
+    ):
         raise ValueError(f"{name} contains NaN or infinite values.")
-    return arr.astype(np.int64)
+    return arr.astype(np.int64, copy=False)
 
 
 def validate_iv_arrays(
@@ -131,8 +131,8 @@ def _cluster_warnings(
     clusters: IntArray, *, k: int, threshold: int = CLUSTER_WARN_THRESHOLD
 ) -> tuple[str, ...]:
     warnings_list: list[str] = []
-    uniq, counts = np.unique(clusters, return_counts=True)
-    G = int(uniq.size)
+    counts = np.bincount(clusters)
+    G = int(counts.size)
     if threshold > G:
         warnings_list.append(f"few clusters (G={G}); inference may be unreliable")
     if np.any(counts == 1):
@@ -166,6 +166,49 @@ def _cluster_codes(spec: ClusterSpec) -> IntArray:
     return spec.codes[0]
 
 
+def _n_clusters(codes: IntArray) -> int:
+    # ClusterSpec codes are already contiguous from 0; no need to re-sort them.
+    return int(codes.max()) + 1
+
+
+# At this many lags the FFT lag sum beats one GEMM per lag (n = 500 to 50000).
+_HAC_FFT_MIN_LAGS = 32
+
+
+def _hac_lag_sum(
+    U1: FloatArray, U2: FloatArray, *, lags: int, kernel: str
+) -> FloatArray:
+    """
+    One-sided weighted lag sum sum_{l=1}^{L} w(l) U1[l:]' U2[:-l].
+
+    The sum equals U1' C with C[t] = sum_l w(l) U2[t - l], a causal filter of
+    U2's columns. For long bandwidths C comes from one zero-padded real FFT,
+    so the cost no longer grows with the number of lags.
+    """
+    weights = np.array(
+        [0.0] + [_kernel_weight(lag, lags, kernel=kernel) for lag in range(1, lags + 1)]
+    )
+    n = U1.shape[0]
+    if lags >= _HAC_FFT_MIN_LAGS and lags < n:
+        import scipy.fft
+
+        size = scipy.fft.next_fast_len(n + lags, real=True)
+        filtered = scipy.fft.irfft(
+            scipy.fft.rfft(U2, size, axis=0) * scipy.fft.rfft(weights, size)[:, None],
+            size,
+            axis=0,
+        )[:n]
+        return cast(FloatArray, U1.T @ filtered)
+
+    total = np.zeros((U1.shape[1], U2.shape[1]), dtype=np.float64)
+    for lag in range(1, lags + 1):
+        weight = weights[lag]
+        if weight <= 0:
+            continue
+        total += weight * (U1[lag:].T @ U2[:-lag])
+    return total
+
+
 def _hac_meat(
     *,
     X: FloatArray,
@@ -180,12 +223,9 @@ def _hac_meat(
     Xu1 = X2 * r1
     Xu2 = X2 * r2
     meat = Xu1.T @ Xu2
-    for lag in range(1, lags + 1):
-        weight = _kernel_weight(lag, lags, kernel=kernel)
-        if weight <= 0:
-            continue
-        gamma = Xu1[lag:].T @ Xu2[:-lag]
-        meat += weight * (gamma + gamma.T)
+    if lags > 0:
+        gamma = _hac_lag_sum(Xu1, Xu2, lags=lags, kernel=kernel)
+        meat += gamma + gamma.T
     return cast(FloatArray, meat)
 
 
@@ -225,7 +265,7 @@ def cov_ols(
     warnings_list: list[str] = []
 
     if spec.cov_type == "unadjusted":
-        sigma2 = float(((r.T @ r) / df_resid).item())
+        sigma2 = float(np.vdot(r, r)) / df_resid
         cov_mat = sigma2 * bread
         return CovarianceResult(
             cov=cov_mat, cov_type="unadjusted", df_resid=df_resid, nobs=n
@@ -265,8 +305,7 @@ def cov_ols(
         if spec.clusters is None:
             raise ValueError("clusters must be provided when cov_type='cluster'.")
         g = _cluster_codes(spec.clusters)
-        uniq, inv = np.unique(g, return_inverse=True)
-        G = int(uniq.size)
+        G = _n_clusters(g)
         if G < 2:
             raise ValueError("cluster covariance requires at least 2 clusters.")
 
@@ -274,7 +313,7 @@ def cov_ols(
 
         meat = np.zeros((p, p), dtype=np.float64)
         for gi in range(G):
-            idx = inv == gi
+            idx = g == gi
             Xg = X2[idx, :]
             rg = r[idx, :]
             sg = Xg.T @ rg
@@ -315,53 +354,56 @@ class MomentCovarianceResult:
 def _moment_meat(
     *,
     X: FloatArray,
-    resid1: FloatArray,
-    resid2: FloatArray,
+    resid: FloatArray,
     cov_type: str,
     clusters: ClusterSpec | None,
     hac_lags: int | None,
     kernel: str,
 ) -> FloatArray:
+    """
+    Joint meat for m residual columns sharing the regressors X.
+
+    Scores for every residual are stacked as U = [X * r_1, ..., X * r_m], so
+    leverage, cluster sums and HAC autocovariances are computed once for all
+    (i, j) blocks instead of once per pair. Block (i, j) of the (m p, m p)
+    result equals the single-pair meat for (r_i, r_j).
+    """
     X2 = np.asarray(X, dtype=np.float64)
-    r1 = np.asarray(resid1, dtype=np.float64).reshape(-1, 1)
-    r2 = np.asarray(resid2, dtype=np.float64).reshape(-1, 1)
+    R = np.asarray(resid, dtype=np.float64)
+    if R.ndim == 1:
+        R = R.reshape(-1, 1)
     n, p = X2.shape
-    if r1.shape[0] != n or r2.shape[0] != n:
+    m = R.shape[1]
+    if R.shape[0] != n:
         raise ValueError("residuals must match X rows.")
 
     if cov_type in ("HC2", "HC3"):
         h = _leverage(X2).reshape(-1, 1)
         scale = np.clip(1.0 - h, 1e-12, None)
-        if cov_type == "HC2":
-            r1 = r1 / np.sqrt(scale)
-            r2 = r2 / np.sqrt(scale)
-        else:
-            r1 = r1 / scale
-            r2 = r2 / scale
+        R = R / np.sqrt(scale) if cov_type == "HC2" else R / scale
+
+    U = (X2[:, None, :] * R[:, :, None]).reshape(n, m * p)
 
     if cov_type == "cluster":
         if clusters is None:
             raise ValueError("clusters must be provided when cov_type='cluster'.")
-        g = _cluster_codes(clusters)
-        uniq, inv = np.unique(g, return_inverse=True)
-        G = int(uniq.size)
+        inv = _cluster_codes(clusters)
+        G = _n_clusters(inv)
         if G < 2:
             raise ValueError("cluster covariance requires at least 2 clusters.")
-        meat = np.zeros((p, p), dtype=np.float64)
-        for gi in range(G):
-            idx = inv == gi
-            Xg = X2[idx, :]
-            s1 = Xg.T @ r1[idx, :]
-            s2 = Xg.T @ r2[idx, :]
-            meat += s1 @ s2.T
-        return cast(FloatArray, meat)
+        sums = np.zeros((G, m * p), dtype=np.float64)
+        np.add.at(sums, inv, U)
+        return cast(FloatArray, sums.T @ sums)
 
+    meat = U.T @ U
     if cov_type == "HAC":
         lags = hac_lags if hac_lags is not None else _default_hac_lags(n)
-        return _hac_meat(X=X2, resid1=r1, resid2=r2, lags=lags, kernel=kernel)
-
-    w = r1 * r2
-    return cast(FloatArray, X2.T @ (X2 * w))
+        if lags > 0:
+            gamma = _hac_lag_sum(U, U, lags=lags, kernel=kernel)
+            # Symmetrize each (i, j) block on its own, as _hac_meat does per pair.
+            gamma_t = gamma.reshape(m, p, m, p).transpose(0, 3, 2, 1).reshape(m * p, -1)
+            meat += gamma + gamma_t
+    return cast(FloatArray, meat)
 
 
 def compute_moment_cov(
@@ -400,28 +442,27 @@ def compute_moment_cov(
     df_resid = n - p
 
     warnings_list: list[str] = []
-    meat = _moment_meat(
-        X=X2,
-        resid1=r,
-        resid2=r,
-        cov_type=spec.cov_type,
-        clusters=spec.clusters,
-        hac_lags=spec.hac_lags,
-        kernel=spec.kernel,
-    )
-    cov_mat = bread @ meat @ bread
-
     if spec.cov_type == "unadjusted":
-        sigma2 = float(((r.T @ r) / df_resid).item())
+        sigma2 = float(np.vdot(r, r)) / df_resid
         cov_mat = sigma2 * bread
-    elif spec.cov_type == "HC1" and small_sample_adj:
+    else:
+        meat = _moment_meat(
+            X=X2,
+            resid=r,
+            cov_type=spec.cov_type,
+            clusters=spec.clusters,
+            hac_lags=spec.hac_lags,
+            kernel=spec.kernel,
+        )
+        cov_mat = bread @ meat @ bread
+
+    if spec.cov_type == "HC1" and small_sample_adj:
         cov_mat *= n / df_resid
     elif spec.cov_type == "cluster" and small_sample_adj:
         if spec.clusters is None:
             raise ValueError("clusters must be provided when cov_type='cluster'.")
         g = _cluster_codes(spec.clusters)
-        uniq, _ = np.unique(g, return_inverse=True)
-        G = int(uniq.size)
+        G = _n_clusters(g)
         cov_mat *= (G / (G - 1)) * ((n - 1) / df_resid)
         warnings_list.extend(_cluster_warnings(g, k=p))
         if np.linalg.matrix_rank(cov_mat) < p:
@@ -436,7 +477,7 @@ def compute_moment_cov(
         nobs=n,
         n_clusters=None
         if spec.cov_type != "cluster" or spec.clusters is None
-        else int(np.unique(_cluster_codes(spec.clusters)).size),
+        else _n_clusters(_cluster_codes(spec.clusters)),
         warnings=tuple(warnings_list),
     )
 
@@ -492,45 +533,26 @@ def cov_reduced_form(
     df_adj = df_resid if df_resid_adj is None else df_resid_adj
 
     warnings_list: list[str] = []
-    meat_yy = _moment_meat(
-        X=X2,
-        resid1=ry,
-        resid2=ry,
-        cov_type=spec.cov_type,
-        clusters=spec.clusters,
-        hac_lags=spec.hac_lags,
-        kernel=spec.kernel,
-    )
-    meat_dd = _moment_meat(
-        X=X2,
-        resid1=rd,
-        resid2=rd,
-        cov_type=spec.cov_type,
-        clusters=spec.clusters,
-        hac_lags=spec.hac_lags,
-        kernel=spec.kernel,
-    )
-    meat_yd = _moment_meat(
-        X=X2,
-        resid1=ry,
-        resid2=rd,
-        cov_type=spec.cov_type,
-        clusters=spec.clusters,
-        hac_lags=spec.hac_lags,
-        kernel=spec.kernel,
-    )
-
-    V_yy = bread @ meat_yy @ bread
-    V_dd = bread @ meat_dd @ bread
-    V_yd = bread @ meat_yd @ bread
-
     if spec.cov_type == "unadjusted":
         sigma = np.hstack([ry, rd])
         sigma_hat = (sigma.T @ sigma) / df_adj
         V_yy = sigma_hat[0, 0] * bread
         V_dd = sigma_hat[1, 1] * bread
         V_yd = sigma_hat[0, 1] * bread
-    elif spec.cov_type == "HC1" and small_sample_adj:
+    else:
+        meat = _moment_meat(
+            X=X2,
+            resid=np.hstack([ry, rd]),
+            cov_type=spec.cov_type,
+            clusters=spec.clusters,
+            hac_lags=spec.hac_lags,
+            kernel=spec.kernel,
+        )
+        V_yy = bread @ meat[:p, :p] @ bread
+        V_dd = bread @ meat[p:, p:] @ bread
+        V_yd = bread @ meat[:p, p:] @ bread
+
+    if spec.cov_type == "HC1" and small_sample_adj:
         V_yy *= n / df_adj
         V_dd *= n / df_adj
         V_yd *= n / df_adj
@@ -538,8 +560,7 @@ def cov_reduced_form(
         if spec.clusters is None:
             raise ValueError("clusters must be provided when cov_type='cluster'.")
         g = _cluster_codes(spec.clusters)
-        uniq, _ = np.unique(g, return_inverse=True)
-        G = int(uniq.size)
+        G = _n_clusters(g)
         adj = (G / (G - 1)) * ((n - 1) / df_adj)
         V_yy *= adj
         V_dd *= adj
@@ -560,6 +581,6 @@ def cov_reduced_form(
         nobs=n,
         n_clusters=None
         if spec.cov_type != "cluster" or spec.clusters is None
-        else int(np.unique(_cluster_codes(spec.clusters)).size),
+        else _n_clusters(_cluster_codes(spec.clusters)),
         warnings=tuple(warnings_list),
     )
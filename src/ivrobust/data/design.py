@@ -5,7 +5,7 @@ from collections.abc import Iterable
 import numpy as np
 
 from .._typing import FloatArray
-from ..linalg.ops import proj, resid
+from ..linalg.ops import proj_many, resid_many
 
 
 def add_constant(x: FloatArray) -> FloatArray:
@@ -33,7 +33,7 @@ def partial_out(x: FloatArray, *args: FloatArray) -> tuple[FloatArray, ...]:
     """
     if x.size == 0:
         return args
-    return tuple(resid(x, a) for a in args)
+    return resid_many(x, *args)
 
 
 def project_on(x: FloatArray, *args: FloatArray) -> tuple[FloatArray, ...]:
@@ -42,7 +42,7 @@ def project_on(x: FloatArray, *args: FloatArray) -> tuple[FloatArray, ...]:
     """
     if x.size == 0:
         return tuple(np.zeros_like(a) for a in args)
-    return tuple(proj(x, a) for a in args)
+    return proj_many(x, *args)
 
 
 def column_names(prefix: str, n: int) -> list[str]:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Any
 
 import numpy as np
@@ -121,6 +122,20 @@ class IVData:
         assert self.shapes is not None
         return self.shapes.p_exog
 
+    @cached_property
+    def y_std(self) -> float:
+        """
+        Standard deviation of y (ddof=0), computed once per IVData.
+        """
+        return float(np.std(self.y))
+
+    @cached_property
+    def d_std(self) -> float:
+        """
+        Standard deviation of d (ddof=0), computed once per IVData.
+        """
+        return float(np.std(self.d))
+
     def with_clusters(self, clusters: np.ndarray) -> IVData:
         return IVData(y=self.y, d=self.d, x=self.x, z=self.z, clusters=clusters)
 
@@ -4,16 +4,15 @@ from dataclasses import dataclass, field
 from typing import Any
 
 import numpy as np
-from scipy.stats import chi2, f
+from scipy.special import fdtrc
 
 from ..covariance import CovSpec, CovType
 from ..data import IVData
-from ..linalg.ops import sym_solve
 from ..utils.warnings import WarningCategory, warn
-from ..weakiv_utils import reduced_form
+from ..weakiv_utils import ReducedFormResult, chi2_sf, reduced_form
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FirstStageDiagnostics:
     """
     First-stage diagnostics for a single endogenous regressor.
@@ -28,7 +27,7 @@ class FirstStageDiagnostics:
     nobs: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EffectiveFResult:
     """
     Effective F statistic for weak-instrument diagnostics (single endogenous regressor).
@@ -43,7 +42,7 @@ class EffectiveFResult:
     warnings: tuple[str, ...] = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WeakIdDiagnostics:
     effective_f: float
     first_stage_f: float
@@ -87,7 +86,7 @@ def first_stage_diagnostics(data: IVData) -> FirstStageDiagnostics:
         raise ValueError("Need n > number of first-stage regressors.")
 
     f_stat = ((rss_r - rss_f) / df_num) / (rss_f / df_denom)
-    pval = float(f.sf(f_stat, df_num, df_denom))
+    pval = float(fdtrc(df_num, df_denom, max(f_stat, 0.0)))
 
     partial = (rss_r - rss_f) / max(rss_r, 1e-30)
 
@@ -114,6 +113,7 @@ def effective_f(
     clusters: np.ndarray | None = None,
     hac_lags: int | None = None,
     kernel: str = "bartlett",
+    rf: ReducedFormResult | None = None,
 ) -> EffectiveFResult:
     """
     Compute the effective F statistic (Montiel Olea & Pflueger) for p_endog=1.
@@ -121,17 +121,17 @@ def effective_f(
     if data.p_endog != 1:
         raise NotImplementedError("effective_f currently supports p_endog=1.")
 
-    rf = reduced_form(
-        data,
-        cov_type=cov_type,
-        cov=cov,
-        clusters=clusters,
-        hac_lags=hac_lags,
-        kernel=kernel,
-    )
+    if rf is None:
+        rf = reduced_form(
+            data,
+            cov_type=cov_type,
+            cov=cov,
+            clusters=clusters,
+            hac_lags=hac_lags,
+            kernel=kernel,
+        )
     k = rf.k_instr
-    V_dd = rf.cov[k:, k:]
-    stat = float((rf.pi_d.T @ sym_solve(V_dd, rf.pi_d)).ravel()[0] / k)
+    stat = rf.first_stage_wald / k
 
     df_denom = data.nobs - data.k_instr - data.p_exog
     if df_denom <= 0:
@@ -165,22 +165,38 @@ def kp_rk_stat(
     clusters: np.ndarray | None = None,
     hac_lags: int | None = None,
     kernel: str = "bartlett",
+    rf: ReducedFormResult | None = None,
 ) -> tuple[float, float, int]:
-    rf = reduced_form(
-        data,
-        cov_type=cov_type,
-        cov=cov,
-        clusters=clusters,
-        hac_lags=hac_lags,
-        kernel=kernel,
-    )
+    if rf is None:
+        rf = reduced_form(
+            data,
+            cov_type=cov_type,
+            cov=cov,
+            clusters=clusters,
+            hac_lags=hac_lags,
+            kernel=kernel,
+        )
     k = rf.k_instr
-    V_dd = rf.cov[k:, k:]
-    stat = float((rf.pi_d.T @ sym_solve(V_dd, rf.pi_d)).ravel()[0])
-    pval = float(chi2.sf(stat, df=k))
+    stat = rf.first_stage_wald
+    pval = chi2_sf(stat, k)
     return stat, pval, k
 
 
+# Stock-Yogo critical values for 10% maximal TSLS size, k_endog=1, by k_instr.
+_STOCK_YOGO_10PCT = {
+    1: 16.38,
+    2: 8.96,
+    3: 7.25,
+    4: 6.16,
+    5: 5.47,
+    6: 4.99,
+    7: 4.64,
+    8: 4.39,
+    9: 4.19,
+    10: 4.03,
+}
+
+
 def stock_yogo_critical_values(
     k_endog: int, k_instr: int, *, size_distortion: float = 0.10
 ) -> float:
@@ -193,21 +209,9 @@ def stock_yogo_critical_values(
     if size_distortion != 0.10:
         raise NotImplementedError("Only size_distortion=0.10 is available.")
 
-    table = {
-        1: 16.38,
-        2: 8.96,
-        3: 7.25,
-        4: 6.16,
-        5: 5.47,
-        6: 4.99,
-        7: 4.64,
-        8: 4.39,
-        9: 4.19,
-        10: 4.03,
-    }
-    if k_instr not in table:
+    if k_instr not in _STOCK_YOGO_10PCT:
         raise NotImplementedError("Stock-Yogo table supports k_instr in 1..10.")
-    return table[k_instr]
+    return _STOCK_YOGO_10PCT[k_instr]
 
 
 def weak_id_diagnostics(
@@ -218,24 +222,21 @@ def weak_id_diagnostics(
     clusters: np.ndarray | None = None,
     hac_lags: int | None = None,
     kernel: str = "bartlett",
+    rf: ReducedFormResult | None = None,
 ) -> WeakIdDiagnostics:
     diag = first_stage_diagnostics(data)
-    eff = effective_f(
-        data,
-        cov=cov,
-        cov_type=cov_type,
-        clusters=clusters,
-        hac_lags=hac_lags,
-        kernel=kernel,
-    )
-    rk_stat, rk_pval, _ = kp_rk_stat(
-        data,
-        cov=cov,
-        cov_type=cov_type,
-        clusters=clusters,
-        hac_lags=hac_lags,
-        kernel=kernel,
-    )
+    # The effective F and KP rk statistics share one reduced-form fit.
+    if rf is None:
+        rf = reduced_form(
+            data,
+            cov_type=cov_type,
+            cov=cov,
+            clusters=clusters,
+            hac_lags=hac_lags,
+            kernel=kernel,
+        )
+    eff = effective_f(data, cov=cov, cov_type=cov_type, rf=rf)
+    rk_stat, rk_pval, _ = kp_rk_stat(data, rf=rf)
 
     if eff.statistic < 10.0:
         warn(
@@ -260,7 +261,7 @@ def weak_id_diagnostics(
         effective_f=eff.statistic,
         first_stage_f=diag.f_statistic,
         partial_r2=diag.partial_r2,
-        cragg_donald_f=cragg_donald_f(data),
+        cragg_donald_f=diag.f_statistic,
         kp_rk_stat=rk_stat,
         kp_rk_pvalue=rk_pval,
         nobs=data.nobs,
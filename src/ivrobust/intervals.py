@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import cast
 
 import numpy as np
 
@@ -14,12 +15,28 @@ class IntervalSet:
     A (possibly disjoint) set of intervals on the real line.
 
     Intervals are represented as (lower, upper), where bounds may be -inf/inf.
+    The endpoints are also packed into an (N, 2) float64 array (columns lower,
+    upper) so that set-level queries and plotting can use NumPy directly.
     """
 
     intervals: list[tuple[float, float]]
+    _endpoints: FloatArray = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        endpoints = np.asarray(self.intervals, dtype=np.float64).reshape(-1, 2)
+        endpoints.flags.writeable = False
+        object.__setattr__(self, "_endpoints", endpoints)
+
+    @property
+    def endpoints(self) -> FloatArray:
+        """
+        Read-only (N, 2) array of interval endpoints (lower, upper).
+        """
+        return self._endpoints
 
     def contains(self, x: float) -> bool:
-        return any(lo <= x <= hi for lo, hi in self.intervals)
+        lo, hi = self._endpoints[:, 0], self._endpoints[:, 1]
+        return bool(((lo <= x) & (x <= hi)).any())
 
     @property
     def is_empty(self) -> bool:
@@ -27,18 +44,15 @@ class IntervalSet:
 
     @property
     def is_unbounded(self) -> bool:
-        return any(
-            (not (lo > float("-inf")) or not (hi < float("inf")))
-            for lo, hi in self.intervals
-        )
+        return not bool(np.isfinite(self._endpoints).all())
 
     @property
     def is_real_line(self) -> bool:
-        normalized = self.normalized()
+        endpoints = self.normalized().endpoints
         return (
-            len(normalized.intervals) == 1
-            and normalized.intervals[0][0] == float("-inf")
-            and normalized.intervals[0][1] == float("inf")
+            endpoints.shape[0] == 1
+            and bool(np.isneginf(endpoints[0, 0]))
+            and bool(np.isposinf(endpoints[0, 1]))
         )
 
     @property
@@ -66,10 +80,10 @@ class IntervalSet:
         if not self.intervals:
             return IntervalSet(intervals=[])
 
-        intervals = sorted(
-            ((float(lo), float(hi)) for lo, hi in self.intervals),
-            key=lambda pair: (pair[0], pair[1]),
-        )
+        intervals = [(float(lo), float(hi)) for lo, hi in self.intervals]
+        # Sets built by grid inversion are already ordered; only sort otherwise.
+        if not bool((np.diff(self._endpoints[:, 0]) >= 0).all()):
+            intervals.sort(key=lambda pair: (pair[0], pair[1]))
         merged: list[tuple[float, float]] = [intervals[0]]
         for lo, hi in intervals[1:]:
             prev_lo, prev_hi = merged[-1]
@@ -111,67 +125,131 @@ def invert_pvalue_grid(
         raise ValueError("grid must be strictly increasing.")
 
     inside = pvals >= alpha
-    idx = np.flatnonzero(inside)
-    if idx.size == 0:
+    if not inside.any():
         return IntervalSet(intervals=[])
 
-    segments: list[tuple[int, int]] = []
-    start = idx[0]
-    prev = idx[0]
-    for j in idx[1:]:
-        if j == prev + 1:
-            prev = j
-            continue
-        segments.append((start, prev))
-        start = j
-        prev = j
-    segments.append((start, prev))
-
     if refine and pvalue_func is None:
         raise ValueError("pvalue_func must be provided when refine=True.")
 
-    def bisect(a: float, b: float) -> float:
-        if pvalue_func is None:
-            return 0.5 * (a + b)
-        fa = pvalue_func(a) - alpha
-        fb = pvalue_func(b) - alpha
-        if fa == 0.0:
-            return a
-        if fb == 0.0:
-            return b
-        if fa * fb > 0.0:
-            return 0.5 * (a + b)
-
-        left, right = a, b
-        for _ in range(max_refine_iter):
-            mid = 0.5 * (left + right)
-            fm = pvalue_func(mid) - alpha
-            if abs(fm) <= refine_tol or abs(right - left) <= refine_tol:
-                return mid
-            if fa * fm <= 0:
-                right = mid
-                fb = fm
-            else:
-                left = mid
-                fa = fm
-        return 0.5 * (left + right)
-
-    refined: list[tuple[float, float]] = []
-    for seg_start, seg_end in segments:
-        left = float(grid1[seg_start])
-        right = float(grid1[seg_end])
-
-        unbounded_left = seg_start == 0
-        unbounded_right = seg_end == grid1.size - 1
-
-        if refine:
-            if not unbounded_left:
-                left = bisect(float(grid1[seg_start - 1]), left)
-            if not unbounded_right:
-                right = bisect(right, float(grid1[seg_end + 1]))
-
-        refined.append(
-            (-np.inf if unbounded_left else left, np.inf if unbounded_right else right)
-        )
-
-    return IntervalSet(intervals=refined)
+    # Accepted runs start where the padded mask steps up and end where it
+    # steps down.
+    edges = np.diff(np.concatenate(([False], inside, [False])).astype(np.int8))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1) - 1
+    unbounded_left = starts == 0
+    unbounded_right = ends == grid1.size - 1
+
+    if refine:
+        lefts = grid1[starts].tolist()
+        rights = grid1[ends].tolist()
+        func = cast(Callable[[float], float], pvalue_func)
+        for i in range(starts.size):
+            if not unbounded_left[i]:
+                j = int(starts[i])
+                lefts[i] = _refine_crossing(
+                    func,
+                    alpha,
+                    grid1[j - 1],
+                    grid1[j],
+                    pvals[j - 1],
+                    pvals[j],
+                    refine_tol,
+                    max_refine_iter,
+                )
+            if not unbounded_right[i]:
+                j = int(ends[i])
+                rights[i] = _refine_crossing(
+                    func,
+                    alpha,
+                    grid1[j],
+                    grid1[j + 1],
+                    pvals[j],
+                    pvals[j + 1],
+                    refine_tol,
+                    max_refine_iter,
+                )
+        left_arr = np.asarray(lefts, dtype=np.float64)
+        right_arr = np.asarray(rights, dtype=np.float64)
+    else:
+        # Without extra test evaluations, place each endpoint at the linear
+        # interpolation of the alpha crossing between neighbouring grid points.
+        prev = np.maximum(starts - 1, 0)
+        nxt = np.minimum(ends + 1, grid1.size - 1)
+        left_arr = _interpolate_crossing(grid1, pvals, alpha, prev, starts)
+        right_arr = _interpolate_crossing(grid1, pvals, alpha, ends, nxt)
+
+    left_arr = np.where(unbounded_left, -np.inf, left_arr)
+    right_arr = np.where(unbounded_right, np.inf, right_arr)
+    return IntervalSet(
+        intervals=list(zip(left_arr.tolist(), right_arr.tolist(), strict=True))
+    )
+
+
+def _refine_crossing(
+    pvalue_func: Callable[[float], float],
+    alpha: float,
+    a: float,
+    b: float,
+    pa: float,
+    pb: float,
+    tol: float,
+    max_iter: int,
+) -> float:
+    """
+    Locate p(beta) = alpha in [a, b] by safeguarded false position.
+
+    The grid p-values at both ends seed the first step, so the opening
+    guess is the linear interpolant and costs no extra test evaluation.
+    Subsequent steps use the Illinois variant of regula falsi, which keeps
+    the bracket and converges superlinearly on the smooth p-value curves
+    produced by the tests; a step that lands outside the bracket falls back
+    to bisection.
+    """
+    a, b = float(a), float(b)
+    fa = float(pa) - alpha
+    fb = float(pb) - alpha
+    if fa == 0.0:
+        return a
+    if fb == 0.0:
+        return b
+    if fa * fb > 0.0:
+        return 0.5 * (a + b)
+
+    side = 0
+    x = 0.5 * (a + b)
+    for _ in range(max_iter):
+        x = b - fb * (b - a) / (fb - fa)
+        if not (a < x < b):
+            x = 0.5 * (a + b)
+        fx = pvalue_func(x) - alpha
+        if abs(fx) <= tol or abs(b - a) <= tol:
+            return x
+        if fa * fx < 0.0:
+            b, fb = x, fx
+            if side == -1:
+                fa *= 0.5
+            side = -1
+        else:
+            a, fa = x, fx
+            if side == 1:
+                fb *= 0.5
+            side = 1
+    return x
+
+
+def _interpolate_crossing(
+    grid: FloatArray,
+    pvalues: FloatArray,
+    alpha: float,
+    i0: np.ndarray,
+    i1: np.ndarray,
+) -> FloatArray:
+    """
+    Vectorized linear interpolation of p(beta) = alpha between grid[i0], grid[i1].
+    """
+    g0, g1 = grid[i0], grid[i1]
+    p0, p1 = pvalues[i0], pvalues[i1]
+    dp = p1 - p0
+    safe = dp != 0.0
+    frac = np.divide(alpha - p0, dp, out=np.zeros_like(dp), where=safe)
+    return cast(FloatArray, g0 + np.clip(frac, 0.0, 1.0) * (g1 - g0))
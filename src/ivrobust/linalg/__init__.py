@@ -1,12 +1,25 @@
 from __future__ import annotations
 
-from .ops import pinv_solve, proj, qr_residualize, resid, sym_quadform, sym_solve
+from .ops import (
+    orth_basis,
+    pinv_solve,
+    proj,
+    proj_many,
+    qr_residualize,
+    resid,
+    resid_many,
+    sym_quadform,
+    sym_solve,
+)
 
 __all__ = [
+    "orth_basis",
     "pinv_solve",
     "proj",
+    "proj_many",
     "qr_residualize",
     "resid",
+    "resid_many",
     "sym_quadform",
     "sym_solve",
 ]
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import cast
 
 import numpy as np
+from scipy.linalg import cho_factor, cho_solve
 
 from .._typing import FloatArray
 
@@ -14,6 +15,28 @@ def _as_2d(x: FloatArray) -> FloatArray:
     return arr
 
 
+def _is_intercept(x: FloatArray) -> bool:
+    """
+    True when x is a single nonzero constant column.
+    """
+    x2 = _as_2d(x)
+    if x2.shape[1] != 1 or x2.shape[0] == 0:
+        return False
+    c = x2[0, 0]
+    return bool(c != 0 and np.all(x2 == c))
+
+
+def orth_basis(X: FloatArray) -> FloatArray:
+    """
+    Orthonormal basis Q (thin QR) for the column space of X.
+
+    Factor X once with this and reuse Q when several arrays are projected
+    onto (or residualized on) the same X.
+    """
+    q, _ = np.linalg.qr(_as_2d(X), mode="reduced")
+    return cast(FloatArray, q)
+
+
 def qr_residualize(y: FloatArray, X: FloatArray) -> FloatArray:
     """
     Residualize y on X using a QR projection.
@@ -30,20 +53,41 @@ def proj(X: FloatArray, Y: FloatArray) -> FloatArray:
     """
     Project Y onto the column space of X via QR.
     """
-    Y2 = _as_2d(Y)
-    X2 = _as_2d(X)
-    if X2.size == 0:
-        return np.zeros_like(Y2)
-    q, _ = np.linalg.qr(X2, mode="reduced")
-    return cast(FloatArray, q @ (q.T @ Y2))
+    return proj_many(X, Y)[0]
 
 
 def resid(X: FloatArray, Y: FloatArray) -> FloatArray:
     """
     Residualize Y on X via QR projections.
     """
-    Y2 = _as_2d(Y)
-    return Y2 - proj(X, Y2)
+    return resid_many(X, Y)[0]
+
+
+def proj_many(X: FloatArray, *Ys: FloatArray) -> tuple[FloatArray, ...]:
+    """
+    Project each Y onto the column space of X with a single QR of X.
+    """
+    X2 = _as_2d(X)
+    if X2.size == 0:
+        return tuple(np.zeros_like(Y2) for Y2 in map(_as_2d, Ys))
+    q = orth_basis(X2)
+    return tuple(q @ (q.T @ Y2) for Y2 in map(_as_2d, Ys))
+
+
+def resid_many(X: FloatArray, *Ys: FloatArray) -> tuple[FloatArray, ...]:
+    """
+    Residualize each Y on X with a single QR of X.
+
+    When X is a single nonzero constant column this is plain demeaning and
+    the factorization is skipped.
+    """
+    X2 = _as_2d(X)
+    if X2.size == 0:
+        return tuple(map(_as_2d, Ys))
+    if _is_intercept(X2):
+        return tuple(Y2 - Y2.mean(axis=0, keepdims=True) for Y2 in map(_as_2d, Ys))
+    q = orth_basis(X2)
+    return tuple(Y2 - q @ (q.T @ Y2) for Y2 in map(_as_2d, Ys))
 
 
 def sym_quadform(A: FloatArray, x: FloatArray) -> float:
@@ -52,7 +96,7 @@ def sym_quadform(A: FloatArray, x: FloatArray) -> float:
     """
     A2 = np.asarray(A, dtype=np.float64)
     x2 = _as_2d(x)
-    return float((x2.T @ A2 @ x2).ravel()[0])
+    return float(np.vdot(x2, A2 @ x2))
 
 
 def pinv_solve(A: FloatArray, b: FloatArray, *, rcond: float = 1e-12) -> FloatArray:
@@ -77,7 +121,9 @@ def sym_solve(
     if jitter > 0:
         A2 = A2 + np.eye(A2.shape[0]) * jitter
     try:
-        c = np.linalg.cholesky(A2)
-        return np.linalg.solve(c.T, np.linalg.solve(c, _as_2d(b)))
+        # Inputs are covariance blocks built from validated data, so skip
+        # SciPy's finiteness scans; POTRF/POTRS replaces two general LU solves.
+        factor = cho_factor(A2, lower=True, check_finite=False)
+        return cast(FloatArray, cho_solve(factor, _as_2d(b), check_finite=False))
     except np.linalg.LinAlgError:
         return pinv_solve(A2, b, rcond=rcond)
@@ -123,6 +123,17 @@ def savefig(
     # Tight layout without surprises
     fig.tight_layout()
 
+    # With savefig.bbox="tight" every savefig call performs its own layout
+    # draw to measure the tight bounding box. Draw once here and hand the
+    # padded bbox to each format so only the final render remains per format.
+    bbox: Any = None
+    get_renderer = getattr(fig.canvas, "get_renderer", None)
+    if plt.rcParams["savefig.bbox"] == "tight" and get_renderer is not None:
+        fig.canvas.draw()
+        bbox = fig.get_tightbbox(get_renderer()).padded(
+            plt.rcParams["savefig.pad_inches"]
+        )
+
     written: list[Path] = []
     for fmt in formats:
         fmt_clean = fmt.lower().lstrip(".")
@@ -130,6 +141,8 @@ def savefig(
         kwargs: dict[str, object] = {}
         if dpi is not None and fmt_clean in {"png", "jpg", "jpeg", "tif", "tiff"}:
             kwargs["dpi"] = int(dpi)
+        if bbox is not None:
+            kwargs["bbox_inches"] = bbox
 
         fig.savefig(out, **kwargs)
         written.append(out)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import math
 from typing import Any
 
 import numpy as np
@@ -33,18 +34,18 @@ def plot_ar_confidence_set(
     else:
         fig = ax.figure
 
-    intervals = cs.confidence_set.intervals
-    if not intervals:
+    endpoints = cs.confidence_set.endpoints
+    if endpoints.shape[0] == 0:
         ax.text(0.5, 0.5, "Empty confidence set", ha="center", va="center")
         ax.set_axis_off()
         return fig, ax
 
     grid = cs.grid_info.get("grid")
     if grid is None:
-        finite = [val for pair in intervals for val in pair if np.isfinite(val)]
-        if finite:
-            grid_min = float(min(finite))
-            grid_max = float(max(finite))
+        finite = endpoints[np.isfinite(endpoints)]
+        if finite.size:
+            grid_min = float(finite.min())
+            grid_max = float(finite.max())
         else:
             grid_min, grid_max = -1.0, 1.0
     else:
@@ -52,11 +53,16 @@ def plot_ar_confidence_set(
         grid_max = float(np.max(grid))
 
     y0 = 0.0
-    for (lo, hi) in intervals:
-        x1 = lo if np.isfinite(lo) else grid_min - 0.5
-        x2 = hi if np.isfinite(hi) else grid_max + 0.5
-        ax.plot([x1, x2], [y0, y0], solid_capstyle="butt")
-        ax.scatter([x1, x2], [y0, y0], s=18)
+    left_cap = grid_min - 0.5
+    right_cap = grid_max + 0.5
+    plot = ax.plot
+    scatter = ax.scatter
+    isfinite = math.isfinite
+    for lo, hi in endpoints.tolist():
+        x1 = lo if isfinite(lo) else left_cap
+        x2 = hi if isfinite(hi) else right_cap
+        plot([x1, x2], [y0, y0], solid_capstyle="butt")
+        scatter([x1, x2], [y0, y0], s=18)
 
     ax.set_yticks([])
     ax.set_xlabel(r"$\beta$")
@@ -1,12 +1,41 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from typing import Any
 
+import numpy as np
+
 from .intervals import IntervalSet
 
+_LATEX_SPECIAL = str.maketrans({"_": r"\_", "%": r"\%", "&": r"\&", "#": r"\#"})
+
+
+def _latex_cell(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, float):
+        return f"{value:.4f}"
+    return str(value).translate(_LATEX_SPECIAL)
+
+
+def _latex_tabular(columns: tuple[str, ...], rows: list[tuple[Any, ...]]) -> str:
+    first = rows[0] if rows else columns
+    align = "".join("r" if isinstance(v, (int, float)) else "l" for v in first)
+    body = [" & ".join(_latex_cell(v) for v in row) + r" \\" for row in rows]
+    lines = [
+        r"\begin{tabular}{" + align + "}",
+        r"\toprule",
+        " & ".join(_latex_cell(c) for c in columns) + r" \\",
+        r"\midrule",
+        *body,
+        r"\bottomrule",
+        r"\end{tabular}",
+    ]
+    return "\n".join(lines) + "\n"
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class TestResult:
     statistic: float
     pvalue: float
@@ -22,7 +51,7 @@ class TestResult:
     def metadata(self) -> dict[str, Any]:
         return self.details
 
-    def as_dict(self) -> dict[str, Any]:
+    def as_dict(self, *, deep: bool = True) -> dict[str, Any]:
         return {
             "statistic": self.statistic,
             "pvalue": self.pvalue,
@@ -30,9 +59,9 @@ class TestResult:
             "method": self.method,
             "cov_type": self.cov_type,
             "alpha": self.alpha,
-            "cov_config": dict(self.cov_config),
+            "cov_config": dict(self.cov_config) if deep else self.cov_config,
             "warnings": self.warnings,
-            "details": dict(self.details),
+            "details": dict(self.details) if deep else self.details,
         }
 
     def summary(self) -> str:
@@ -63,12 +92,25 @@ class TestResult:
             ]
         )
 
-    def to_latex(self) -> str:
-        df = self.to_dataframe()
-        return str(df.to_latex(index=False))
+    def to_latex(self, *, use_pandas: bool = False) -> str:
+        if use_pandas:
+            return str(self.to_dataframe().to_latex(index=False))
+        return _latex_tabular(
+            ("statistic", "pvalue", "df", "method", "cov_type", "alpha"),
+            [
+                (
+                    self.statistic,
+                    self.pvalue,
+                    self.df,
+                    self.method,
+                    self.cov_type,
+                    self.alpha,
+                )
+            ],
+        )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConfidenceSetResult:
     confidence_set: IntervalSet
     alpha: float
@@ -96,12 +138,12 @@ class ConfidenceSetResult:
     def grid_diagnostics(self) -> dict[str, Any]:
         return self.grid_info
 
-    def as_dict(self) -> dict[str, Any]:
+    def as_dict(self, *, deep: bool = True) -> dict[str, Any]:
         return {
             "intervals": list(self.intervals),
             "alpha": self.alpha,
             "method": self.method,
-            "grid_info": dict(self.grid_info),
+            "grid_info": dict(self.grid_info) if deep else self.grid_info,
             "warnings": self.warnings,
         }
 
@@ -118,11 +160,12 @@ class ConfidenceSetResult:
             import pandas as pd
         except ImportError as exc:  # pragma: no cover
             raise ImportError("pandas is required for to_dataframe().") from exc
-        return pd.DataFrame(self.intervals, columns=["lower", "upper"])
+        return pd.DataFrame(self.confidence_set.endpoints, columns=["lower", "upper"])
 
-    def to_latex(self) -> str:
-        df = self.to_dataframe()
-        return str(df.to_latex(index=False))
+    def to_latex(self, *, use_pandas: bool = False) -> str:
+        if use_pandas:
+            return str(self.to_dataframe().to_latex(index=False))
+        return _latex_tabular(("lower", "upper"), self.intervals)
 
     def plot(self, *, ax: Any | None = None) -> tuple[Any, Any]:
         from .plots import plot_ar_confidence_set
@@ -137,7 +180,7 @@ class ConfidenceSetResult:
         else:
             fig = ax.figure
 
-        for lo, hi in self.intervals:
+        for lo, hi in self.confidence_set.endpoints:
             ax.plot([lo, hi], [0.0, 0.0], solid_capstyle="butt")
         ax.set_yticks([])
         ax.set_xlabel(r"$\beta$")
@@ -145,7 +188,7 @@ class ConfidenceSetResult:
         return fig, ax
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WeakIVInferenceResult:
     tests: dict[str, TestResult]
     confidence_sets: dict[str, ConfidenceSetResult]
@@ -156,39 +199,37 @@ class WeakIVInferenceResult:
     warnings: tuple[str, ...] = ()
 
     def summary(self) -> str:
-        lines: list[str] = []
-        lines.append("Weak-IV robust inference")
-        lines.append(f"alpha={self.alpha:.3f}, cov_type={self.cov_type}")
+        return "\n".join(self._summary_lines())
+
+    def _summary_lines(self) -> Iterator[str]:
+        yield "Weak-IV robust inference"
+        yield f"alpha={self.alpha:.3f}, cov_type={self.cov_type}"
         if self.warnings:
-            lines.append("warnings: " + "; ".join(self.warnings))
+            yield "warnings: " + "; ".join(self.warnings)
 
         if self.tests:
-            lines.append("")
-            lines.append("Tests")
+            yield ""
+            yield "Tests"
             for name, res in self.tests.items():
-                lines.append(
-                    f"{name}: stat={res.statistic:.4f}, p={res.pvalue:.4f}, df={res.df}"
-                )
+                yield f"{name}: stat={res.statistic:.4f}, p={res.pvalue:.4f}, df={res.df}"
 
         if self.confidence_sets:
-            lines.append("")
-            lines.append("Confidence sets")
+            yield ""
+            yield "Confidence sets"
             for name, cs in self.confidence_sets.items():
-                lines.append(f"{name}: {cs.intervals}")
+                yield f"{name}: {cs.intervals}"
 
         if self.diagnostics:
-            lines.append("")
-            lines.append("Diagnostics")
+            yield ""
+            yield "Diagnostics"
             for name, val in self.diagnostics.items():
-                lines.append(f"{name}: {val}")
-
-        return "\n".join(lines)
+                yield f"{name}: {val}"
 
-    def as_dict(self) -> dict[str, Any]:
+    def as_dict(self, *, deep: bool = True) -> dict[str, Any]:
         return {
-            "tests": {k: v.as_dict() for k, v in self.tests.items()},
+            "tests": {k: v.as_dict(deep=deep) for k, v in self.tests.items()},
             "confidence_sets": {
-                k: v.as_dict() for k, v in self.confidence_sets.items()
+                k: v.as_dict(deep=deep) for k, v in self.confidence_sets.items()
             },
             "recommended": self.recommended,
             "alpha": self.alpha,
@@ -210,7 +251,10 @@ class WeakIVInferenceResult:
         else:
             fig = ax.figure
 
-        methods_to_plot = methods or tuple(self.confidence_sets.keys())
+        methods_to_plot: tuple[str, ...] | dict[str, ConfidenceSetResult] = (
+            methods or self.confidence_sets
+        )
+        curves: list[tuple[str, Any, Any]] = []
         for name in methods_to_plot:
             cs = self.confidence_sets.get(name)
             if cs is None:
@@ -219,7 +263,21 @@ class WeakIVInferenceResult:
             pvals = cs.grid_info.get("pvalues")
             if grid is None or pvals is None:
                 continue
-            ax.plot(grid, pvals, label=name)
+            curves.append((name, grid, pvals))
+
+        shared_grid = len(curves) > 1 and all(
+            grid is curves[0][1] or np.array_equal(grid, curves[0][1])
+            for _, grid, _ in curves[1:]
+        )
+        if shared_grid:
+            lines = ax.plot(
+                curves[0][1], np.column_stack([pvals for _, _, pvals in curves])
+            )
+            for line, (name, _, _) in zip(lines, curves, strict=True):
+                line.set_label(name)
+        else:
+            for name, grid, pvals in curves:
+                ax.plot(grid, pvals, label=name)
 
         ax.axhline(self.alpha, color="black", linestyle="--", linewidth=1.0)
         ax.set_xlabel(r"$\beta$")
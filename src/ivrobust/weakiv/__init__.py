@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 from collections.abc import Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 import numpy as np
 
@@ -13,12 +15,18 @@ from ..diagnostics.strength import (
 )
 from ..estimators.tsls import tsls
 from ..results import ConfidenceSetResult, TestResult, WeakIVInferenceResult
+from ..weakiv_utils import reduced_form
 from .ar import ar_confidence_set, ar_test
 from .clr import clr_confidence_set, clr_test
 from .lm import kp_rank_test, lm_confidence_set, lm_test
 
 
 def _normalize_methods(methods: Iterable[str]) -> tuple[str, ...]:
+    return _normalize_methods_cached(tuple(methods))
+
+
+@lru_cache(maxsize=32)
+def _normalize_methods_cached(methods: tuple[str, ...]) -> tuple[str, ...]:
     out = []
     for m in methods:
         name = m.upper()
@@ -43,6 +51,7 @@ def weakiv_inference(
     grid: np.ndarray | tuple[float, float, int] | None = None,
     return_grid: bool = False,
     recommended: str = "CLR",
+    parallel: bool = False,
 ) -> WeakIVInferenceResult:
     """
     Unified weak-IV robust inference workflow for AR/LM/CLR.
@@ -71,6 +80,10 @@ def weakiv_inference(
         If True, include p-value grids in confidence set diagnostics.
     recommended
         Label of the recommended method (default "CLR").
+    parallel
+        If True, run the selected methods concurrently in a thread pool. This
+        helps when the grid sweeps are dominated by large LAPACK calls; for
+        small instrument counts they are interpreter-bound and gain little.
 
     Returns
     -------
@@ -96,8 +109,18 @@ def weakiv_inference(
     tests: dict[str, TestResult] = {}
     confidence_sets: dict[str, ConfidenceSetResult] = {}
 
-    if "AR" in methods_use:
-        tests["AR"] = ar_test(
+    # Every method works from the same reduced form; fit it once.
+    rf = reduced_form(
+        data,
+        cov_type=cov_type,
+        cov=cov,
+        clusters=clusters,
+        hac_lags=hac_lags,
+        kernel=kernel,
+    )
+
+    def run_ar() -> tuple[TestResult, ConfidenceSetResult]:
+        test = ar_test(
             data,
             beta0=beta0,
             cov=cov,
@@ -106,8 +129,9 @@ def weakiv_inference(
             hac_lags=hac_lags,
             kernel=kernel,
             alpha=alpha,
+            rf=rf,
         )
-        confidence_sets["AR"] = ar_confidence_set(
+        cs = ar_confidence_set(
             data,
             alpha=alpha,
             cov=cov,
@@ -118,10 +142,12 @@ def weakiv_inference(
             grid=grid_array,
             beta_bounds=beta_bounds,
             n_grid=n_grid,
+            rf=rf,
         )
+        return test, cs
 
-    if "LM" in methods_use:
-        tests["LM"] = lm_test(
+    def run_lm() -> tuple[TestResult, ConfidenceSetResult]:
+        test = lm_test(
             data,
             beta0=beta0,
             cov=cov,
@@ -130,8 +156,9 @@ def weakiv_inference(
             hac_lags=hac_lags,
             kernel=kernel,
             alpha=alpha,
+            rf=rf,
         )
-        confidence_sets["LM"] = lm_confidence_set(
+        cs = lm_confidence_set(
             data,
             alpha=alpha,
             cov=cov,
@@ -142,10 +169,12 @@ def weakiv_inference(
             grid=grid_array,
             beta_bounds=beta_bounds,
             n_grid=n_grid,
+            rf=rf,
         )
+        return test, cs
 
-    if "CLR" in methods_use:
-        tests["CLR"] = clr_test(
+    def run_clr() -> tuple[TestResult, ConfidenceSetResult]:
+        test = clr_test(
             data,
             beta0=beta0,
             cov=cov,
@@ -153,8 +182,9 @@ def weakiv_inference(
             clusters=clusters,
             hac_lags=hac_lags,
             kernel=kernel,
+            rf=rf,
         )
-        confidence_sets["CLR"] = clr_confidence_set(
+        cs = clr_confidence_set(
             data,
             alpha=alpha,
             cov=cov,
@@ -165,7 +195,22 @@ def weakiv_inference(
             grid=grid_array,
             beta_bounds=beta_bounds,
             n_grid=n_grid,
+            rf=rf,
         )
+        return test, cs
+
+    runners = {"AR": run_ar, "LM": run_lm, "CLR": run_clr}
+    selected = [name for name in runners if name in methods_use]
+    if parallel and len(selected) > 1:
+        # The methods only read the shared reduced form, so they can run
+        # side by side without coordination.
+        with ThreadPoolExecutor(max_workers=len(selected)) as pool:
+            futures = {name: pool.submit(runners[name]) for name in selected}
+            outcomes = {name: fut.result() for name, fut in futures.items()}
+    else:
+        outcomes = {name: runners[name]() for name in selected}
+    for name in selected:
+        tests[name], confidence_sets[name] = outcomes[name]
 
     warnings: list[str] = []
     if data.k_instr / max(data.nobs, 1) > 0.2:
@@ -180,6 +225,7 @@ def weakiv_inference(
             clusters=clusters,
             hac_lags=hac_lags,
             kernel=kernel,
+            rf=rf,
         ),
         "weak_id": weak_id_diagnostics(
             data,
@@ -188,6 +234,7 @@ def weakiv_inference(
             clusters=clusters,
             hac_lags=hac_lags,
             kernel=kernel,
+            rf=rf,
         ),
         "kp_rk": kp_rank_test(
             data,
@@ -196,6 +243,7 @@ def weakiv_inference(
             clusters=clusters,
             hac_lags=hac_lags,
             kernel=kernel,
+            rf=rf,
         ),
     }
 
@@ -1,18 +1,123 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
+from dataclasses import dataclass
 
 import numpy as np
-from scipy.stats import chi2
 
 from .._typing import FloatArray
+from .._validation import _as_scalar_float
 from ..covariance import CovSpec, CovType
 from ..data import IVData
 from ..linalg.ops import sym_solve
-from ..weakiv_utils import default_beta_bounds, reduced_form
+from ..weakiv_utils import (
+    ReducedFormResult,
+    chi2_sf,
+    default_beta_bounds,
+    reduced_form,
+)
 from .inversion import GridSpec, InversionSpec, invert_test
 from .results import ARTestResult, ConfidenceSetResult
 
+# Betas per batched solve; bounds the (batch, k, k) working array.
+_AR_BATCH = 256
+
+
+@dataclass(frozen=True, slots=True)
+class _ARQuadraticForm:
+    """
+    Beta-independent pieces of the AR statistic g(b)' V_g(b)^-1 g(b).
+
+    g(b) = pi_y - b pi_d and V_g(b) = V_yy - b V_cross + b^2 V_dd with
+    V_cross = V_yd + V_yd'. The blocks are sliced once per reduced form and
+    shared by the grid scan and every refinement step.
+
+    Under unadjusted covariance every reduced-form block is a multiple of the
+    same bread matrix, so V_g(b) = V_yy * (1 - 2 r_yd b + r_dd b^2) with
+    r_yd = s_yd / s_yy and r_dd = s_dd / s_yy. One solve against the base
+    V_yy then gives
+
+        AR(b) = (a - 2 c b + e b^2) / (1 - 2 r_yd b + r_dd b^2)
+
+    with a = pi_y' V_yy^-1 pi_y, c = pi_y' V_yy^-1 pi_d, e = pi_d' V_yy^-1 pi_d,
+    i.e. O(1) work per beta; `closed_form` holds (a, c, e, r_yd, r_dd).
+    """
+
+    pi_y: FloatArray
+    pi_d: FloatArray
+    V_yy: FloatArray
+    V_cross: FloatArray
+    V_dd: FloatArray
+    closed_form: tuple[float, float, float, float, float] | None
+
+    @classmethod
+    def from_reduced_form(cls, rf: ReducedFormResult) -> _ARQuadraticForm:
+        V_yy, V_cross, V_dd = rf.cov_blocks
+        closed_form = None
+        if rf.cov_type == "unadjusted":
+            tr_yy = float(np.trace(V_yy))
+            pis = np.hstack([rf.pi_y, rf.pi_d])
+            M = pis.T @ sym_solve(V_yy, pis)
+            closed_form = (
+                float(M[0, 0]),
+                float(M[0, 1]),
+                float(M[1, 1]),
+                0.5 * float(np.trace(V_cross)) / tr_yy,
+                float(np.trace(V_dd)) / tr_yy,
+            )
+        return cls(
+            pi_y=rf.pi_y,
+            pi_d=rf.pi_d,
+            V_yy=V_yy,
+            V_cross=V_cross,
+            V_dd=V_dd,
+            closed_form=closed_form,
+        )
+
+    def statistic(self, b: float) -> float:
+        if self.closed_form is not None:
+            a, c, e, r_yd, r_dd = self.closed_form
+            return (a - 2.0 * c * b + e * b * b) / (1.0 - 2.0 * r_yd * b + r_dd * b * b)
+        g = self.pi_y - b * self.pi_d
+        V_g = self.V_yy - b * self.V_cross + (b**2) * self.V_dd
+        x = sym_solve(V_g, g)
+        return float(np.vdot(g, x))
+
+    def statistics(self, betas: FloatArray) -> FloatArray:
+        if self.closed_form is not None:
+            a, c, e, r_yd, r_dd = self.closed_form
+            b2 = betas * betas
+            return (a - 2.0 * c * betas + e * b2) / (1.0 - 2.0 * r_yd * betas + r_dd * b2)
+
+        G = self.pi_y - self.pi_d * betas.reshape(1, -1)
+        stats = np.empty(betas.shape[0], dtype=np.float64)
+        for start in range(0, betas.shape[0], _AR_BATCH):
+            b = betas[start : start + _AR_BATCH]
+            g = G[:, start : start + _AR_BATCH].T
+            # (batch, k, k) stack of V_g(b); one batched LAPACK solve per block.
+            V_g = (
+                self.V_yy[None, :, :]
+                - b[:, None, None] * self.V_cross[None, :, :]
+                + (b * b)[:, None, None] * self.V_dd[None, :, :]
+            )
+            try:
+                x = np.linalg.solve(V_g, g[:, :, None])[:, :, 0]
+            except np.linalg.LinAlgError:
+                x = np.stack([sym_solve(V_g[i], g[i]).ravel() for i in range(b.size)])
+            stats[start : start + b.size] = np.einsum("bk,bk->b", g, x)
+        return stats
+
+
+def _ar_statistic(rf: ReducedFormResult, b0: float) -> float:
+    """
+    AR statistic at a single null value from a precomputed reduced form.
+    """
+    g = rf.pi_y - b0 * rf.pi_d
+    V_yy, V_cross, V_dd = rf.cov_blocks
+    V_g = V_yy - b0 * V_cross + (b0**2) * V_dd
+    x = sym_solve(V_g, g)
+    return float(np.vdot(g, x))
+
 
 def ar_test(
     data: IVData,
@@ -24,6 +129,7 @@ def ar_test(
     hac_lags: int | None = None,
     kernel: str = "bartlett",
     alpha: float | None = None,
+    rf: ReducedFormResult | None = None,
 ) -> ARTestResult:
     """
     Anderson-Rubin test of H0: beta = beta0 (single endogenous regressor).
@@ -48,6 +154,9 @@ def ar_test(
         HAC kernel name ("bartlett" or "parzen").
     alpha
         Optional significance level stored in the result.
+    rf
+        Precomputed reduced form for the same data and covariance settings;
+        skips the first-stage regressions when supplied.
 
     Returns
     -------
@@ -58,29 +167,20 @@ def ar_test(
         raise NotImplementedError(
             "ar_test currently supports a single endogenous regressor (p_endog=1)."
         )
-    b0 = float(np.asarray(beta0, dtype=np.float64).ravel()[0])
-    rf = reduced_form(
-        data,
-        cov_type=cov_type,
-        cov=cov,
-        clusters=clusters,
-        hac_lags=hac_lags,
-        kernel=kernel,
-    )
+    b0 = _as_scalar_float(beta0)
+    if rf is None:
+        rf = reduced_form(
+            data,
+            cov_type=cov_type,
+            cov=cov,
+            clusters=clusters,
+            hac_lags=hac_lags,
+            kernel=kernel,
+        )
 
     k = rf.k_instr
-    pi_y = rf.pi_y
-    pi_d = rf.pi_d
-    g = pi_y - b0 * pi_d
-
-    V = rf.cov
-    V_yy = V[:k, :k]
-    V_yd = V[:k, k:]
-    V_dd = V[k:, k:]
-    V_g = V_yy - b0 * (V_yd + V_yd.T) + (b0**2) * V_dd
-    x = sym_solve(V_g, g)
-    stat = float((g.T @ x).ravel()[0])
-    pval = float(chi2.sf(stat, df=k))
+    stat = _ar_statistic(rf, b0)
+    pval = chi2_sf(stat, k)
 
     return ARTestResult(
         statistic=stat,
@@ -113,9 +213,11 @@ def ar_confidence_set(
     grid: FloatArray | None = None,
     beta_bounds: tuple[float, float] | None = None,
     n_grid: int = 2001,
+    adaptive_grid: bool = False,
     refine: bool = True,
     refine_tol: float = 1e-6,
     max_refine_iter: int = 80,
+    rf: ReducedFormResult | None = None,
 ) -> ConfidenceSetResult:
     """
     Invert the AR test to obtain a (possibly disjoint) confidence set for beta.
@@ -130,22 +232,28 @@ def ar_confidence_set(
         )
     if grid is None and beta_bounds is None:
         beta_bounds = default_beta_bounds(data)
-    grid_spec = GridSpec(grid=grid, beta_bounds=beta_bounds, n_grid=n_grid)
+    grid_spec = GridSpec(
+        grid=grid, beta_bounds=beta_bounds, n_grid=n_grid, adaptive=adaptive_grid
+    )
     inversion_spec = InversionSpec(
         refine=refine, refine_tol=refine_tol, max_refine_iter=max_refine_iter
     )
 
-    cs, grid_info = invert_test(
-        test_fn=lambda b: ar_test(
+    if rf is None:
+        rf = reduced_form(
             data,
-            beta0=b,
-            cov=cov,
             cov_type=cov_type,
+            cov=cov,
             clusters=clusters,
             hac_lags=hac_lags,
             kernel=kernel,
-            alpha=alpha,
-        ).pvalue,
+        )
+    k = rf.k_instr
+    form = _ARQuadraticForm.from_reduced_form(rf)
+
+    cs, grid_info = invert_test(
+        batch_fn=lambda betas: chi2_sf(form.statistics(betas), k),
+        test_fn=lambda b: chi2_sf(form.statistic(b), k),
         alpha=alpha,
         grid_spec=grid_spec,
         inversion_spec=inversion_spec,
@@ -1,46 +1,78 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
-from typing import Any, Literal
+from typing import Literal, cast
 
 import numpy as np
-import scipy.integrate
+import scipy.linalg
 import scipy.special
-from scipy.stats import chi2
 
-from ..covariance import CovSpec, CovType, _pinv_sym
+from .._typing import FloatArray
+from .._validation import _as_scalar_float
+from ..covariance import CovSpec, CovType
 from ..data import IVData
-from ..weakiv_utils import default_beta_bounds, md_optimal_pi, proj, reduced_form
+from ..linalg.ops import sym_solve
+from ..weakiv_utils import (
+    ReducedFormResult,
+    chi2_sf,
+    default_beta_bounds,
+    md_optimal_pi,
+    md_optimal_pi_batch,
+    reduced_form,
+)
 from .inversion import GridSpec, InversionSpec, invert_test
 from .results import CLRTestResult, ConfidenceSetResult
 
 
-def _clr_lambda(beta: float, *, rf: Any, p_exog: int) -> float:
-    resid = rf.y - beta * rf.d
-    resid_proj = proj(rf.z, resid)[0]
-    resid_orth = resid - resid_proj
-
-    d_proj = proj(rf.z, rf.d)[0]
-    sigma_hat = float((resid_orth.T @ resid_orth).ravel()[0])
+def _clr_lambda(beta: float, *, rf: ReducedFormResult, p_exog: int) -> float:
+    # With e = y - beta d = Y w and d_tilde = d - Sigma e = Y u for Y = [y, d],
+    # every inner product below is a quadratic form in the reduced-form Gram
+    # matrices, so each beta costs O(1) instead of two projections onto Z.
+    F, R = rf.gram
+    w = np.array([1.0, -beta])
+    Rw = R @ w
+    sigma_hat = float(w @ Rw)
     if sigma_hat <= 0 or not np.isfinite(sigma_hat):
         return 0.0
 
-    Sigma = float((resid_orth.T @ rf.d).ravel()[0]) / sigma_hat
-    d_tilde = rf.d - resid * Sigma
-    d_tilde_proj = d_proj - resid_proj * Sigma
-    d_tilde_orth = d_tilde - d_tilde_proj
+    Sigma = float(Rw[1]) / sigma_hat
+    u = np.array([0.0, 1.0]) - Sigma * w
 
-    denom = float((d_tilde_orth.T @ d_tilde_orth).ravel()[0])
+    denom = float(u @ R @ u)
     if denom <= 0 or not np.isfinite(denom):
         return 0.0
 
     dof = rf.nobs - rf.k_instr - p_exog
     if dof <= 0:
         return 0.0
-    numer = float((d_tilde_proj.T @ d_tilde_proj).ravel()[0])
+    numer = float(u @ F @ u)
     return float(max(0.0, dof * numer / denom))
 
 
+def _clr_lambdas(
+    betas: FloatArray, *, rf: ReducedFormResult, p_exog: int
+) -> FloatArray:
+    """
+    _clr_lambda over a grid of betas as (n_grid, 2) products; degenerate
+    points give 0 as in the scalar version.
+    """
+    F, R = rf.gram
+    b = np.asarray(betas, dtype=np.float64).reshape(-1)
+    dof = rf.nobs - rf.k_instr - p_exog
+    if dof <= 0:
+        return np.zeros_like(b)
+    W = np.column_stack([np.ones_like(b), -b])
+    RW = W @ R
+    sigma_hat = np.einsum("gi,gi->g", W, RW)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        U = np.array([0.0, 1.0]) - (RW[:, 1] / sigma_hat)[:, None] * W
+        denom = np.einsum("gi,gi->g", U, U @ R)
+        numer = np.einsum("gi,gi->g", U, U @ F)
+        lam = dof * numer / denom
+    ok = (sigma_hat > 0) & (denom > 0) & np.isfinite(lam)
+    return np.where(ok, np.maximum(lam, 0.0), 0.0)
+
+
 def _clr_pvalue(
     *,
     stat: float,
@@ -51,7 +83,7 @@ def _clr_pvalue(
     if stat <= 0:
         return 1.0
     if k <= 1 or lambda1 <= 0:
-        return float(chi2.sf(stat, df=k))
+        return chi2_sf(stat, k)
 
     p = 1
     q = k
@@ -59,38 +91,198 @@ def _clr_pvalue(
     beta = p / 2.0
     a = lambda1 / (stat + lambda1)
     if a <= 0:
-        return float(chi2.sf(stat, df=k))
+        return chi2_sf(stat, k)
 
     k_half = q / 2.0
     z_over_2 = stat / 2.0
     const = np.power(a, -alpha - beta + 1) / scipy.special.beta(alpha, beta)
 
+    # Integrate the conditional survival function directly rather than
+    # returning 1 - P(CLR <= stat), which cancels in the upper tail. QUADPACK
+    # calls back into Python per node, so the callback is a bare ufunc call:
+    # the constant is applied once after integration (with epsabs rescaled to
+    # keep the same absolute tolerance) and the ufunc is bound locally.
+    gammaincc = scipy.special.gammaincc
+
     def integrand(y: float) -> float:
-        return float(const * scipy.special.gammainc(k_half, z_over_2 / y))
+        return cast(float, gammaincc(k_half, z_over_2 / y))
+
+    # Deferred: scipy.integrate pulls in most of scipy.stats' import chain.
+    from scipy.integrate import quad
 
-    res = scipy.integrate.quad(
+    value, _ = quad(
         integrand,
         1 - a,
         1,
         weight="alg",
         wvar=(beta - 1, alpha - 1),
-        epsabs=tol,
+        epsabs=tol / const,
     )
-    return float(1 - res[0])
+    return float(min(max(const * value, 0.0), 1.0))
+
+
+def _clr_pvalues(
+    stats: FloatArray, *, k: int, lambdas: FloatArray, tol: float = 1e-6
+) -> FloatArray:
+    """
+    Vectorized _clr_pvalue over matching arrays of statistics and lambda1.
+
+    With y = 1 - a cos^2(t) the Beta-weighted integral in _clr_pvalue becomes
+
+        p = 2 / B((k-1)/2, 1/2) * int_0^{pi/2} cos^{k-2}(t) Q(k/2, s / (2 y)) dt,
+
+    whose integrand is smooth on a fixed interval for every (s, lambda1), so
+    one quad_vec call integrates all of them together.
+    """
+    stats = np.asarray(stats, dtype=np.float64).reshape(-1)
+    lambdas = np.asarray(lambdas, dtype=np.float64).reshape(-1)
+    pvals = np.ones_like(stats)
+    pos = stats > 0
+    if k <= 1:
+        pvals[pos] = chi2_sf(stats[pos], k)
+        return pvals
+    central = pos & (lambdas <= 0)
+    pvals[central] = chi2_sf(stats[central], k)
+    use = pos & ~central
+    if not use.any():
+        return pvals
+
+    s = stats[use]
+    a = lambdas[use] / (s + lambdas[use])
+    half_s = s / 2.0
+    k_half = k / 2.0
+    gammaincc = scipy.special.gammaincc
+
+    def integrand(t: float) -> FloatArray:
+        c2 = np.cos(t) ** 2
+        return cast(
+            FloatArray, c2 ** (k_half - 1) * gammaincc(k_half, half_s / (1 - a * c2))
+        )
+
+    from scipy.integrate import quad_vec
+
+    scale = 2.0 / scipy.special.beta((k - 1) / 2.0, 0.5)
+    value, _ = quad_vec(integrand, 0.0, np.pi / 2, epsabs=tol / scale, norm="max")
+    pvals[use] = np.clip(scale * value, 0.0, 1.0)
+    return pvals
+
+
+def _md_q_min_kronecker(
+    rf: ReducedFormResult, bounds: tuple[float, float]
+) -> tuple[float, float] | None:
+    """
+    Closed-form minimum of the MD criterion under unadjusted covariance.
+
+    There V = S (x) B, and with Pi = [pi_y, pi_d], M = Pi' V_yy^-1 Pi and S
+    scaled so S_yy = 1, min_beta q(beta) is the smallest root of
+    det(M - mu S) = 0 (the LIML eigenvalue); its eigenvector is proportional
+    to (1, -beta_hat). Returns None when beta_hat is unbounded or outside
+    `bounds`, where the bounded search applies instead.
+    """
+    k = rf.k_instr
+    V = rf.cov
+    V_yy = V[:k, :k]
+    tr_yy = float(np.trace(V_yy))
+    if not tr_yy > 0:
+        return None
+    r_yd = float(np.trace(V[:k, k:])) / tr_yy
+    r_dd = float(np.trace(V[k:, k:])) / tr_yy
+    S = np.array([[1.0, r_yd], [r_yd, r_dd]])
+    pis = np.hstack([rf.pi_y, rf.pi_d])
+    M = pis.T @ sym_solve(V_yy, pis)
+    try:
+        evals, evecs = scipy.linalg.eigh(M, S, check_finite=False)
+    except np.linalg.LinAlgError:
+        return None
+    x0, x1 = evecs[:, 0]
+    if abs(x0) <= 1e-12 * abs(x1):
+        return None
+    beta_hat = float(-x1 / x0)
+    if not bounds[0] <= beta_hat <= bounds[1]:
+        return None
+    return beta_hat, max(float(evals[0]), 0.0)
+
+
+def _md_q_min_bracketed(
+    rf: ReducedFormResult, bounds: tuple[float, float]
+) -> tuple[float, float] | None:
+    """
+    Root of dq/dbeta bracketed around the LIML estimate.
+
+    By the envelope theorem dq/dbeta = -2 (V^-1 r)_y' pi_hat, so each step
+    costs one md_optimal_pi call. q typically also has an interior maximum,
+    so the derivative need not change sign across `bounds`; the bracket is
+    grown outward from the seed until dq goes from negative to positive.
+    Returns None when no such bracket exists inside `bounds`, when dq is not
+    finite, or when 64 doublings of the step do not produce one.
+    """
+    import scipy.optimize
+
+    V_inv, k, pi_y, pi_d = rf.cov_inv, rf.k_instr, rf.pi_y, rf.pi_d
+    terms = rf.md_terms
+
+    def dq(b: float) -> float:
+        pi_hat, r, _ = md_optimal_pi(
+            b, V_inv=V_inv, k=k, pi_y=pi_y, pi_d=pi_d, terms=terms
+        )
+        return -2.0 * float(np.vdot((V_inv @ r)[:k], pi_hat))
+
+    F, R = rf.gram
+    try:
+        _, evecs = scipy.linalg.eigh(F, R, check_finite=False)
+    except np.linalg.LinAlgError:
+        return None
+    x0, x1 = evecs[:, 0]
+    lo, hi = bounds
+    if not (np.isfinite(x0) and np.isfinite(x1)) or abs(x0) <= 1e-12 * abs(x1):
+        return None
+    seed = min(max(float(-x1 / x0), lo), hi)
+
+    step = 1e-2 * (hi - lo)
+    a, c = max(seed - step, lo), min(seed + step, hi)
+    da, dc = dq(a), dq(c)
+    for _ in range(64):
+        if not (np.isfinite(da) and np.isfinite(dc)):
+            return None
+        if da < 0.0 < dc:
+            break
+        if (da >= 0.0 and a <= lo) or (dc <= 0.0 and c >= hi):
+            return None
+        step *= 2.0
+        if da >= 0.0:
+            a = max(seed - step, lo)
+            da = dq(a)
+        if dc <= 0.0:
+            c = min(seed + step, hi)
+            dc = dq(c)
+    else:
+        return None
+    beta_hat = float(scipy.optimize.brentq(dq, a, c, xtol=1e-10))
+    _, _, q = md_optimal_pi(
+        beta_hat, V_inv=V_inv, k=k, pi_y=pi_y, pi_d=pi_d, terms=terms
+    )
+    return beta_hat, q
 
 
 def _md_q_min(
-    *,
-    V_inv: np.ndarray,
-    k: int,
-    pi_y: np.ndarray,
-    pi_d: np.ndarray,
-    bounds: tuple[float, float],
+    *, rf: ReducedFormResult, bounds: tuple[float, float]
 ) -> tuple[float, float]:
+    if rf.cov_type == "unadjusted":
+        closed = _md_q_min_kronecker(rf, bounds)
+        if closed is not None:
+            return closed
+    else:
+        bracketed = _md_q_min_bracketed(rf, bounds)
+        if bracketed is not None:
+            return bracketed
+
     import scipy.optimize
 
+    V_inv, k, pi_y, pi_d = rf.cov_inv, rf.k_instr, rf.pi_y, rf.pi_d
+    terms = rf.md_terms
+
     def obj(b: float) -> float:
-        _, _, q = md_optimal_pi(b, V_inv=V_inv, k=k, pi_y=pi_y, pi_d=pi_d)
+        _, _, q = md_optimal_pi(b, V_inv=V_inv, k=k, pi_y=pi_y, pi_d=pi_d, terms=terms)
         return q
 
     res = scipy.optimize.minimize_scalar(
@@ -101,6 +293,45 @@ def _md_q_min(
     return float(res.x), float(res.fun)
 
 
+def _clr_cov_settings(
+    method: str, cov: CovSpec | str | None, cov_type: CovType
+) -> tuple[CovType, CovSpec | str | None, list[str]]:
+    if method.upper() != "CLR":
+        return cov_type, cov, []
+    if cov is not None:
+        return "unadjusted", None, ["CLR ignores cov; using unadjusted covariance."]
+    return "unadjusted", cov, []
+
+
+def _clr_parts(
+    b0: float, *, rf: ReducedFormResult, q_min: float, p_exog: int
+) -> tuple[float, float]:
+    """
+    (statistic, lambda1) at b0 given the beta-free minimum q_min.
+    """
+    _, _, q_beta = md_optimal_pi(
+        b0,
+        V_inv=rf.cov_inv,
+        k=rf.k_instr,
+        pi_y=rf.pi_y,
+        pi_d=rf.pi_d,
+        terms=rf.md_terms,
+    )
+    stat = max(0.0, q_beta - q_min)
+    return stat, _clr_lambda(b0, rf=rf, p_exog=p_exog)
+
+
+def _clr_at(
+    b0: float, *, rf: ReducedFormResult, q_min: float, p_exog: int, tol: float
+) -> tuple[float, float, float]:
+    """
+    (statistic, lambda1, p-value) at b0 given the beta-free minimum q_min.
+    """
+    stat, lambda1 = _clr_parts(b0, rf=rf, q_min=q_min, p_exog=p_exog)
+    pval = _clr_pvalue(stat=stat, k=rf.k_instr, lambda1=lambda1, tol=tol)
+    return stat, lambda1, pval
+
+
 def clr_test(
     data: IVData,
     beta0: float | Sequence[float],
@@ -112,6 +343,7 @@ def clr_test(
     kernel: str = "bartlett",
     method: Literal["CLR", "CQLR"] = "CQLR",
     tol: float = 1e-6,
+    rf: ReducedFormResult | None = None,
 ) -> CLRTestResult:
     """
     Conditional likelihood ratio (CLR/CQLR) test for H0: beta = beta0 (scalar).
@@ -121,39 +353,22 @@ def clr_test(
             "clr_test currently supports a single endogenous regressor (p_endog=1)."
         )
 
-    b0 = float(np.asarray(beta0, dtype=np.float64).ravel()[0])
-    cov_type_use = cov_type
-    cov_use = cov
-    warnings: list[str] = []
-    if method.upper() == "CLR":
-        cov_type_use = "unadjusted"
-        if cov is not None:
-            warnings.append("CLR ignores cov; using unadjusted covariance.")
-            cov_use = None
-
-    rf = reduced_form(
-        data,
-        cov_type=cov_type_use,
-        cov=cov_use,
-        clusters=clusters,
-        hac_lags=hac_lags,
-        kernel=kernel,
-    )
-
-    k = rf.k_instr
-    V_inv = _pinv_sym(rf.cov)
-    _, _, q_beta = md_optimal_pi(
-        b0, V_inv=V_inv, k=k, pi_y=rf.pi_y, pi_d=rf.pi_d
-    )
+    b0 = _as_scalar_float(beta0)
+    cov_type_use, cov_use, warnings = _clr_cov_settings(method, cov, cov_type)
 
-    bounds = default_beta_bounds(data)
-    _, q_min = _md_q_min(
-        V_inv=V_inv, k=k, pi_y=rf.pi_y, pi_d=rf.pi_d, bounds=bounds
-    )
-    stat = max(0.0, q_beta - q_min)
+    if rf is None or (cov_type_use == "unadjusted" and rf.cov_type != "unadjusted"):
+        rf = reduced_form(
+            data,
+            cov_type=cov_type_use,
+            cov=cov_use,
+            clusters=clusters,
+            hac_lags=hac_lags,
+            kernel=kernel,
+        )
 
-    lambda1 = _clr_lambda(b0, rf=rf, p_exog=data.p_exog)
-    pval = _clr_pvalue(stat=stat, k=k, lambda1=lambda1, tol=tol)
+    k = rf.k_instr
+    _, q_min = _md_q_min(rf=rf, bounds=default_beta_bounds(data))
+    stat, lambda1, pval = _clr_at(b0, rf=rf, q_min=q_min, p_exog=data.p_exog, tol=tol)
 
     warnings.extend(rf.warnings)
     if data.p_exog + k >= data.nobs:
@@ -188,10 +403,12 @@ def clr_confidence_set(
     grid: np.ndarray | None = None,
     beta_bounds: tuple[float, float] | None = None,
     n_grid: int = 2001,
+    adaptive_grid: bool = False,
     refine: bool = True,
     refine_tol: float = 1e-6,
     max_refine_iter: int = 80,
     tol: float = 1e-6,
+    rf: ReducedFormResult | None = None,
 ) -> ConfidenceSetResult:
     """
     Invert the CLR test to obtain a (possibly disjoint) confidence set for beta.
@@ -203,22 +420,45 @@ def clr_confidence_set(
 
     if grid is None and beta_bounds is None:
         beta_bounds = default_beta_bounds(data)
-    grid_spec = GridSpec(grid=grid, beta_bounds=beta_bounds, n_grid=n_grid)
+    grid_spec = GridSpec(
+        grid=grid, beta_bounds=beta_bounds, n_grid=n_grid, adaptive=adaptive_grid
+    )
     inversion_spec = InversionSpec(
         refine=refine, refine_tol=refine_tol, max_refine_iter=max_refine_iter
     )
-    cs, grid_info = invert_test(
-        test_fn=lambda b: clr_test(
+    cov_type_use, cov_use, _ = _clr_cov_settings(method, cov, cov_type)
+    if rf is None or (cov_type_use == "unadjusted" and rf.cov_type != "unadjusted"):
+        rf = reduced_form(
             data,
-            beta0=b,
-            cov=cov,
-            cov_type=cov_type,
+            cov_type=cov_type_use,
+            cov=cov_use,
             clusters=clusters,
             hac_lags=hac_lags,
             kernel=kernel,
-            method=method,
-            tol=tol,
-        ).pvalue,
+        )
+    # The profiled minimum over beta is the same for every grid point; find it
+    # once instead of re-running the bounded search per evaluation.
+    _, q_min = _md_q_min(rf=rf, bounds=default_beta_bounds(data))
+    reduced = rf
+
+    def batch_fn(betas: FloatArray) -> FloatArray:
+        _, _, q_betas = md_optimal_pi_batch(
+            betas,
+            V_inv=reduced.cov_inv,
+            k=reduced.k_instr,
+            pi_y=reduced.pi_y,
+            pi_d=reduced.pi_d,
+            terms=reduced.md_terms,
+        )
+        stats = np.maximum(q_betas - q_min, 0.0)
+        lambdas = _clr_lambdas(betas, rf=reduced, p_exog=data.p_exog)
+        return _clr_pvalues(stats, k=reduced.k_instr, lambdas=lambdas, tol=tol)
+
+    cs, grid_info = invert_test(
+        batch_fn=batch_fn,
+        test_fn=lambda b: _clr_at(
+            b, rf=reduced, q_min=q_min, p_exog=data.p_exog, tol=tol
+        )[2],
         alpha=alpha,
         grid_spec=grid_spec,
         inversion_spec=inversion_spec,
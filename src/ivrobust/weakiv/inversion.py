@@ -15,6 +15,7 @@ class GridSpec:
     grid: FloatArray | None = None
     beta_bounds: tuple[float, float] | None = None
     n_grid: int = 2001
+    adaptive: bool = False
 
 
 @dataclass(frozen=True)
@@ -25,13 +26,62 @@ class InversionSpec:
     hysteresis: float = 1e-12
 
 
+_COARSE_STRIDE = 8
+_NEAR_ALPHA = 0.1
+
+
+def _coarse_to_fine(
+    grid: FloatArray,
+    evaluate: Callable[[FloatArray], FloatArray],
+    alpha: float,
+) -> tuple[FloatArray, FloatArray]:
+    """
+    Evaluate every _COARSE_STRIDE-th grid point, then fill in the fine grid
+    only inside coarse cells where either end has p >= _NEAR_ALPHA * alpha.
+
+    Cells entirely far below alpha cannot hold an accepted region unless the
+    p-value curve spikes between two coarse points, so they keep only their
+    endpoints; crossings and near misses are resolved at full resolution.
+    """
+    n = grid.size
+    if n <= 2 * _COARSE_STRIDE:
+        return grid, evaluate(grid)
+    coarse = np.unique(np.r_[np.arange(0, n, _COARSE_STRIDE), n - 1])
+    p_coarse = evaluate(grid[coarse])
+
+    hot = np.maximum(p_coarse[:-1], p_coarse[1:]) >= _NEAR_ALPHA * alpha
+    cell = np.minimum(
+        np.searchsorted(coarse, np.arange(n), side="right") - 1, coarse.size - 2
+    )
+    keep = hot[cell]
+    keep[coarse] = True
+    fill = keep.copy()
+    fill[coarse] = False
+
+    pvals = np.empty(n, dtype=np.float64)
+    pvals[coarse] = p_coarse
+    if fill.any():
+        pvals[fill] = evaluate(grid[fill])
+    return grid[keep], pvals[keep]
+
+
 def invert_test(
     *,
     test_fn: Callable[[float], float],
     alpha: float,
     grid_spec: GridSpec,
     inversion_spec: InversionSpec,
+    batch_fn: Callable[[FloatArray], FloatArray] | None = None,
 ) -> tuple[IntervalSet, dict[str, object]]:
+    """
+    Invert a scalar test into a confidence set over a beta grid.
+
+    test_fn maps beta to a p-value and is used for endpoint refinement. When
+    batch_fn is given, it maps the whole grid to p-values in one call and
+    replaces the pointwise scan of test_fn. With grid_spec.adaptive the grid
+    is scanned coarse-to-fine (see _coarse_to_fine) and grid_info reports
+    only the points actually evaluated.
+    """
     if not (0.0 < alpha < 1.0):
         raise ValueError("alpha must be in (0, 1).")
 
@@ -50,10 +100,18 @@ def invert_test(
             raise ValueError("grid must contain at least 3 points.")
         lo, hi = float(grid[0]), float(grid[-1])
 
+    def evaluate(betas: FloatArray) -> FloatArray:
+        if batch_fn is not None:
+            return np.asarray(batch_fn(betas), dtype=np.float64).reshape(-1)
+        return np.fromiter(
+            (test_fn(b0) for b0 in betas.tolist()), dtype=np.float64, count=betas.size
+        )
+
     start = time.perf_counter()
-    pvals = np.empty_like(grid)
-    for i, b0 in enumerate(grid):
-        pvals[i] = float(test_fn(float(b0)))
+    if grid_spec.adaptive:
+        grid, pvals = _coarse_to_fine(grid, evaluate, alpha)
+    else:
+        pvals = evaluate(grid)
     runtime = time.perf_counter() - start
 
     cs = invert_pvalue_grid(
@@ -63,7 +121,7 @@ def invert_test(
         refine=inversion_spec.refine,
         refine_tol=inversion_spec.refine_tol,
         max_refine_iter=inversion_spec.max_refine_iter,
-        pvalue_func=(lambda b: float(test_fn(float(b)))),
+        pvalue_func=test_fn,
     )
 
     grid_info = {
@@ -72,6 +130,7 @@ def invert_test(
         "beta_bounds": (lo, hi),
         "n_grid": int(grid.size),
         "evaluations": int(grid.size),
+        "adaptive": grid_spec.adaptive,
         "runtime": float(runtime),
         "alpha": float(alpha),
     }
@@ -3,79 +3,76 @@ from __future__ import annotations
 from collections.abc import Sequence
 
 import numpy as np
-from scipy.stats import chi2
 
-from ..covariance import CovSpec, CovType, _pinv_sym
+from .._typing import FloatArray
+from .._validation import _as_scalar_float
+from ..covariance import CovSpec, CovType
 from ..data import IVData
 from ..linalg.ops import sym_solve
-from ..weakiv_utils import default_beta_bounds, md_optimal_pi, proj, reduced_form
+from ..weakiv_utils import (
+    ReducedFormResult,
+    chi2_sf,
+    default_beta_bounds,
+    md_optimal_pi,
+    md_optimal_pi_batch,
+    reduced_form,
+)
 from .inversion import GridSpec, InversionSpec, invert_test
 from .results import ConfidenceSetResult, LMTestResult
 
 
-def kp_lm_test(
-    data: IVData,
-    beta0: float | Sequence[float],
+def _lm_statistic(
+    b0: float,
     *,
-    cov: CovSpec | str | None = None,
-    cov_type: CovType = "HC1",
-    clusters: np.ndarray | None = None,
-    hac_lags: int | None = None,
-    kernel: str = "bartlett",
-    alpha: float | None = None,
-) -> LMTestResult:
+    rf: ReducedFormResult,
+    homoskedastic: bool,
+    p_exog: int,
+    warnings: list[str],
+) -> float:
     """
-    Kleibergen-Paap LM test for H0: beta = beta0 (scalar).
+    KP-LM statistic at b0 from a fitted reduced form; notes go to warnings.
     """
-    if data.p_endog != 1:
-        raise NotImplementedError(
-            "kp_lm_test currently supports a single endogenous regressor (p_endog=1)."
-        )
-
-    b0 = float(np.asarray(beta0, dtype=np.float64).ravel()[0])
-    rf = reduced_form(
-        data,
-        cov_type=cov_type,
-        cov=cov,
-        clusters=clusters,
-        hac_lags=hac_lags,
-        kernel=kernel,
-    )
-    k = rf.k_instr
-
-    warnings: list[str] = list(rf.warnings)
-    if cov_type == "unadjusted" and cov is None:
-        residuals = rf.y - b0 * rf.d
-        residuals_proj = proj(rf.z, residuals)[0]
-        residuals_orth = residuals - residuals_proj
-
-        sigma_hat = float((residuals_orth.T @ residuals_orth).ravel()[0])
+    if homoskedastic:
+        # Inner products of e = y - b0 d with its projection on Z follow from
+        # the reduced-form Gram matrices, so no n-length residual is formed.
+        F, R = rf.gram
+        w = np.array([1.0, -b0])
+        Rw = R @ w
+        sigma_hat = float(w @ Rw)
         if sigma_hat <= 0 or not np.isfinite(sigma_hat):
             warnings.append("LM sigma_hat not positive; statistic set to 0")
             stat = 0.0
         else:
-            Sigma = float((residuals_orth.T @ rf.d).ravel()[0]) / sigma_hat
-            d_proj = proj(rf.z, rf.d)[0]
-            x_tilde_proj = d_proj - residuals_proj * Sigma
-            xtx = float((x_tilde_proj.T @ x_tilde_proj).ravel()[0])
+            Sigma = float(Rw[1]) / sigma_hat
+            # x_tilde_proj = P (d - Sigma e) has weights u on the (y, d) columns.
+            u = np.array([0.0, 1.0]) - Sigma * w
+            Fu = F @ u
+            xtx = float(u @ Fu)
             if xtx <= 0 or not np.isfinite(xtx):
                 warnings.append("LM projection not positive; statistic set to 0")
                 stat = 0.0
             else:
-                proj_resid = x_tilde_proj * (x_tilde_proj.T @ residuals) / xtx
-                dof = data.nobs - data.k_instr - data.p_exog
+                xte = float(Fu @ w)
+                dof = rf.nobs - rf.k_instr - p_exog
                 if dof <= 0:
                     warnings.append("LM degrees of freedom nonpositive")
-                    dof = data.nobs - data.k_instr
-                stat = float(dof * (proj_resid.T @ proj_resid).ravel()[0] / sigma_hat)
+                    dof = rf.nobs - rf.k_instr
+                stat = dof * (xte * xte / xtx) / sigma_hat
     else:
-        V_inv = _pinv_sym(rf.cov)
+        V_inv = rf.cov_inv
         pi_hat, r, _ = md_optimal_pi(
-            b0, V_inv=V_inv, k=k, pi_y=rf.pi_y, pi_d=rf.pi_d
+            b0,
+            V_inv=V_inv,
+            k=rf.k_instr,
+            pi_y=rf.pi_y,
+            pi_d=rf.pi_d,
+            terms=rf.md_terms,
         )
         dvec = np.vstack([pi_hat, np.zeros_like(pi_hat)])
-        score = float((dvec.T @ sym_solve(rf.cov, r)).ravel()[0])
-        info = float((dvec.T @ sym_solve(rf.cov, dvec)).ravel()[0])
+        # One factorization of V for both the score and information solves.
+        score, info = (
+            (dvec.T @ sym_solve(rf.cov, np.hstack([r, dvec]))).ravel().tolist()
+        )
 
         if info <= 0 or not np.isfinite(info):
             warnings.append("LM information term not positive; statistic set to 0")
@@ -83,7 +80,100 @@ def kp_lm_test(
         else:
             stat = (score**2) / info
 
-    pval = float(chi2.sf(stat, df=1))
+    return float(stat)
+
+
+def _lm_statistics(
+    betas: FloatArray, *, rf: ReducedFormResult, p_exog: int
+) -> FloatArray:
+    """
+    Homoskedastic LM statistics over a grid of betas from the Gram matrices.
+
+    Row-wise version of the unadjusted branch of _lm_statistic: each beta
+    only changes the weights w = (1, -b) on the (y, d) columns, so the whole
+    grid is a few (n_grid, 2) products. Degenerate points give 0.
+    """
+    F, R = rf.gram
+    b = np.asarray(betas, dtype=np.float64).reshape(-1)
+    W = np.column_stack([np.ones_like(b), -b])
+    RW = W @ R
+    sigma_hat = np.einsum("gi,gi->g", W, RW)
+    dof = rf.nobs - rf.k_instr - p_exog
+    if dof <= 0:
+        dof = rf.nobs - rf.k_instr
+    with np.errstate(divide="ignore", invalid="ignore"):
+        Sigma = RW[:, 1] / sigma_hat
+        U = np.array([0.0, 1.0]) - Sigma[:, None] * W
+        FU = U @ F
+        xtx = np.einsum("gi,gi->g", U, FU)
+        xte = np.einsum("gi,gi->g", FU, W)
+        stat = dof * (xte * xte / xtx) / sigma_hat
+    ok = (sigma_hat > 0) & (xtx > 0) & np.isfinite(stat)
+    return np.where(ok, stat, 0.0)
+
+
+def _lm_md_statistics(betas: FloatArray, *, rf: ReducedFormResult) -> FloatArray:
+    """
+    Minimum-distance LM statistics over a grid of betas.
+
+    Row-wise version of the robust branch of _lm_statistic, weighting by the
+    cached V^-1: score = pi_hat' (V^-1 r)_y and info = pi_hat' (V^-1)_yy pi_hat.
+    Degenerate points give 0.
+    """
+    k = rf.k_instr
+    V_inv = rf.cov_inv
+    pi_hat, r, _ = md_optimal_pi_batch(
+        betas, V_inv=V_inv, k=k, pi_y=rf.pi_y, pi_d=rf.pi_d, terms=rf.md_terms
+    )
+    score = np.einsum("gi,gi->g", (r @ V_inv)[:, :k], pi_hat)
+    info = np.einsum("gi,gi->g", pi_hat @ V_inv[:k, :k], pi_hat)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        stat = score * score / info
+    ok = (info > 0) & np.isfinite(stat)
+    return np.where(ok, stat, 0.0)
+
+
+def kp_lm_test(
+    data: IVData,
+    beta0: float | Sequence[float],
+    *,
+    cov: CovSpec | str | None = None,
+    cov_type: CovType = "HC1",
+    clusters: np.ndarray | None = None,
+    hac_lags: int | None = None,
+    kernel: str = "bartlett",
+    alpha: float | None = None,
+    rf: ReducedFormResult | None = None,
+) -> LMTestResult:
+    """
+    Kleibergen-Paap LM test for H0: beta = beta0 (scalar).
+    """
+    if data.p_endog != 1:
+        raise NotImplementedError(
+            "kp_lm_test currently supports a single endogenous regressor (p_endog=1)."
+        )
+
+    b0 = _as_scalar_float(beta0)
+    if rf is None:
+        rf = reduced_form(
+            data,
+            cov_type=cov_type,
+            cov=cov,
+            clusters=clusters,
+            hac_lags=hac_lags,
+            kernel=kernel,
+        )
+    k = rf.k_instr
+
+    warnings: list[str] = list(rf.warnings)
+    stat = _lm_statistic(
+        b0,
+        rf=rf,
+        homoskedastic=cov_type == "unadjusted" and cov is None,
+        p_exog=data.p_exog,
+        warnings=warnings,
+    )
+    pval = chi2_sf(stat, 1)
 
     return LMTestResult(
         statistic=float(stat),
@@ -110,6 +200,7 @@ def lm_test(
     hac_lags: int | None = None,
     kernel: str = "bartlett",
     alpha: float | None = None,
+    rf: ReducedFormResult | None = None,
 ) -> LMTestResult:
     return kp_lm_test(
         data,
@@ -120,6 +211,7 @@ def lm_test(
         hac_lags=hac_lags,
         kernel=kernel,
         alpha=alpha,
+        rf=rf,
     )
 
 
@@ -131,6 +223,7 @@ def kp_rank_test(
     clusters: np.ndarray | None = None,
     hac_lags: int | None = None,
     kernel: str = "bartlett",
+    rf: ReducedFormResult | None = None,
 ) -> LMTestResult:
     """
     Kleibergen-Paap rk underidentification test (scalar endogenous regressor).
@@ -139,18 +232,18 @@ def kp_rank_test(
         raise NotImplementedError(
             "kp_rank_test currently supports a single endogenous regressor (p_endog=1)."
         )
-    rf = reduced_form(
-        data,
-        cov_type=cov_type,
-        cov=cov,
-        clusters=clusters,
-        hac_lags=hac_lags,
-        kernel=kernel,
-    )
+    if rf is None:
+        rf = reduced_form(
+            data,
+            cov_type=cov_type,
+            cov=cov,
+            clusters=clusters,
+            hac_lags=hac_lags,
+            kernel=kernel,
+        )
     k = rf.k_instr
-    V_dd = rf.cov[k:, k:]
-    stat = float((rf.pi_d.T @ sym_solve(V_dd, rf.pi_d)).ravel()[0])
-    pval = float(chi2.sf(stat, df=k))
+    stat = rf.first_stage_wald
+    pval = chi2_sf(stat, k)
     return LMTestResult(
         statistic=stat,
         pvalue=pval,
@@ -177,9 +270,11 @@ def lm_confidence_set(
     grid: np.ndarray | None = None,
     beta_bounds: tuple[float, float] | None = None,
     n_grid: int = 2001,
+    adaptive_grid: bool = False,
     refine: bool = True,
     refine_tol: float = 1e-6,
     max_refine_iter: int = 80,
+    rf: ReducedFormResult | None = None,
 ) -> ConfidenceSetResult:
     if data.p_endog != 1:
         raise NotImplementedError(
@@ -188,21 +283,42 @@ def lm_confidence_set(
 
     if grid is None and beta_bounds is None:
         beta_bounds = default_beta_bounds(data)
-    grid_spec = GridSpec(grid=grid, beta_bounds=beta_bounds, n_grid=n_grid)
+    grid_spec = GridSpec(
+        grid=grid, beta_bounds=beta_bounds, n_grid=n_grid, adaptive=adaptive_grid
+    )
     inversion_spec = InversionSpec(
         refine=refine, refine_tol=refine_tol, max_refine_iter=max_refine_iter
     )
-    cs, grid_info = invert_test(
-        test_fn=lambda b: lm_test(
+    if rf is None:
+        rf = reduced_form(
             data,
-            beta0=b,
-            cov=cov,
             cov_type=cov_type,
+            cov=cov,
             clusters=clusters,
             hac_lags=hac_lags,
             kernel=kernel,
-            alpha=alpha,
-        ).pvalue,
+        )
+    reduced = rf
+    homoskedastic = cov_type == "unadjusted" and cov is None
+
+    # Only the statistic depends on beta; skip rebuilding a result per point.
+    cs, grid_info = invert_test(
+        batch_fn=lambda betas: chi2_sf(
+            _lm_statistics(betas, rf=reduced, p_exog=data.p_exog)
+            if homoskedastic
+            else _lm_md_statistics(betas, rf=reduced),
+            1,
+        ),
+        test_fn=lambda b: chi2_sf(
+            _lm_statistic(
+                b,
+                rf=reduced,
+                homoskedastic=homoskedastic,
+                p_exog=data.p_exog,
+                warnings=[],
+            ),
+            1,
+        ),
         alpha=alpha,
         grid_spec=grid_spec,
         inversion_spec=inversion_spec,
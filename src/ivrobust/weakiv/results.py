@@ -16,7 +16,7 @@ LMConfidenceSetResult = ConfidenceSetResult
 CLRConfidenceSetResult = ConfidenceSetResult
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GridDiagnostics:
     grid: np.ndarray
     pvalues: np.ndarray
@@ -1,14 +1,19 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
+from typing import cast, overload
 
 import numpy as np
+from scipy.special import chdtrc
 
 from ._typing import FloatArray, IntArray
-from .covariance import CovSpec, CovType, cov_reduced_form
+from .covariance import CovSpec, CovType, _pinv_sym, cov_reduced_form
 from .data import IVData
-from .linalg.ops import proj as _proj
-from .linalg.ops import resid as _resid
+from .linalg.ops import proj_many, resid_many, sym_solve
+
+# (M1, M2, M3, c1, c2); see _md_terms.
+MDTerms = tuple[FloatArray, FloatArray, FloatArray, FloatArray, FloatArray]
 
 
 @dataclass(frozen=True)
@@ -27,14 +32,78 @@ class ReducedFormResult:
     k_instr: int
     warnings: tuple[str, ...]
 
+    @cached_property
+    def cov_inv(self) -> FloatArray:
+        """
+        Pseudo-inverse of the joint (pi_y, pi_d) covariance, computed once.
+
+        The minimum-distance LM/CLR statistics weight by V^-1 at every beta;
+        only the k x k combinations b^2 V11 + b (V12 + V21) + V22 depend on b.
+        """
+        return _pinv_sym(self.cov)
+
+    @cached_property
+    def cov_blocks(self) -> tuple[FloatArray, FloatArray, FloatArray]:
+        """
+        (V_yy, V_yd + V_yd', V_dd) as contiguous k x k arrays, built once.
+
+        V_g(b) = V_yy - b (V_yd + V_yd') + b^2 V_dd for the AR moment only
+        needs these beta-free pieces; the symmetrised cross block is formed
+        here rather than on every evaluation.
+        """
+        k = self.k_instr
+        V = self.cov
+        V_yd = V[:k, k:]
+        return (
+            np.ascontiguousarray(V[:k, :k]),
+            V_yd + V_yd.T,
+            np.ascontiguousarray(V[k:, k:]),
+        )
+
+    @cached_property
+    def md_terms(self) -> MDTerms:
+        """
+        Beta-free pieces of the minimum-distance normal equations, built once.
+
+        See _md_terms; every md_optimal_pi call on this reduced form then
+        needs only scalar-times-matrix updates before its k x k solve.
+        """
+        return _md_terms(self.cov_inv, self.k_instr, self.pi_y, self.pi_d)
+
+    @cached_property
+    def first_stage_wald(self) -> float:
+        """
+        Wald statistic pi_d' V_dd^-1 pi_d for H0: pi_d = 0, computed once.
+
+        The effective F, KP rk statistic and KP rank test are all this
+        quadratic form (up to scaling), so diagnostics on one reduced form
+        share a single V_dd solve.
+        """
+        k = self.k_instr
+        V_dd = self.cov[k:, k:]
+        return float(np.vdot(self.pi_d, sym_solve(V_dd, self.pi_d)))
+
+    @cached_property
+    def gram(self) -> tuple[FloatArray, FloatArray]:
+        """
+        2x2 cross-products of the stacked (y, d) columns: (fitted, residual).
+
+        For e(b) = y - b d, the projection of e onto Z and its orthogonal part
+        have Gram entries w' F w and w' R w with w = (1, -b), so per-beta
+        statistics built from these inner products need no n-length passes.
+        """
+        resid = np.hstack([self.resid_y, self.resid_d])
+        fitted = np.hstack([self.y, self.d]) - resid
+        return fitted.T @ fitted, resid.T @ resid
+
 
 def partial_out(x: FloatArray, *args: FloatArray) -> tuple[FloatArray, ...]:
     """
-    Residualize each array in args on x using least squares.
+    Residualize each array in args on x (one QR of x for all of them).
     """
     if x.size == 0:
         return args
-    return tuple(_resid(x, a) for a in args)
+    return resid_many(x, *args)
 
 
 def proj(z: FloatArray, *args: FloatArray) -> tuple[FloatArray, ...]:
@@ -43,7 +112,7 @@ def proj(z: FloatArray, *args: FloatArray) -> tuple[FloatArray, ...]:
     """
     if z.size == 0:
         return tuple(np.zeros_like(a) for a in args)
-    return tuple(_proj(z, a) for a in args)
+    return proj_many(z, *args)
 
 
 def reduced_form(
@@ -61,22 +130,14 @@ def reduced_form(
     if data.p_endog != 1:
         raise NotImplementedError("reduced_form currently supports p_endog=1.")
 
-    y = data.y.reshape(-1, 1)
-    d = data.d.reshape(-1, 1)
-    z = data.z
-    x = data.x
-
-    y_tilde, d_tilde, z_tilde = partial_out(x, y, d, z)
-
-    Z = np.asarray(z_tilde, dtype=np.float64)
-    YD = np.hstack([y_tilde, d_tilde])
-    coef, *_ = np.linalg.lstsq(Z, YD, rcond=None)
+    # Residualize y and d as one (n, 2) block; the columns below are views.
+    YD, Z = partial_out(data.x, np.column_stack([data.y, data.d]), data.z)
+    coef = cast(FloatArray, np.linalg.lstsq(Z, YD, rcond=None)[0])
     resid = YD - Z @ coef
 
-    pi_y = coef[:, [0]].astype(np.float64)
-    pi_d = coef[:, [1]].astype(np.float64)
-    resid_y = resid[:, [0]].astype(np.float64)
-    resid_d = resid[:, [1]].astype(np.float64)
+    y_tilde, d_tilde = YD[:, 0:1], YD[:, 1:2]
+    pi_y, pi_d = coef[:, 0:1], coef[:, 1:2]
+    resid_y, resid_d = resid[:, 0:1], resid[:, 1:2]
 
     clusters_use = clusters if clusters is not None else data.clusters
     cov_res = cov_reduced_form(
@@ -108,6 +169,26 @@ def reduced_form(
     )
 
 
+def _md_terms(V_inv: np.ndarray, k: int, pi_y: np.ndarray, pi_d: np.ndarray) -> MDTerms:
+    """
+    (M1, M2, M3, c1, c2) with A(b) = b^2 M1 + b M2 + M3 and B(b) = b c1 + c2.
+
+    With V_inv blocked as [[V11, V12], [V21, V22]], M1 = V11, M2 = V12 + V21,
+    M3 = V22, c1 = V11 pi_y + V12 pi_d and c2 = V21 pi_y + V22 pi_d.
+    """
+    V11 = V_inv[:k, :k]
+    V12 = V_inv[:k, k:]
+    V21 = V_inv[k:, :k]
+    V22 = V_inv[k:, k:]
+    return (
+        np.ascontiguousarray(V11),
+        V12 + V21,
+        np.ascontiguousarray(V22),
+        V11 @ pi_y + V12 @ pi_d,
+        V21 @ pi_y + V22 @ pi_d,
+    )
+
+
 def md_optimal_pi(
     beta: float,
     *,
@@ -115,31 +196,102 @@ def md_optimal_pi(
     k: int,
     pi_y: np.ndarray,
     pi_d: np.ndarray,
+    terms: MDTerms | None = None,
 ) -> tuple[np.ndarray, np.ndarray, float]:
     """
     Minimum-distance projection for reduced-form coefficients under beta.
+
+    Pass `terms` (e.g. ReducedFormResult.md_terms) to reuse the beta-free
+    pieces across calls.
     """
-    V11 = V_inv[:k, :k]
-    V12 = V_inv[:k, k:]
-    V21 = V_inv[k:, :k]
-    V22 = V_inv[k:, k:]
+    M1, M2, M3, c1, c2 = terms if terms is not None else _md_terms(V_inv, k, pi_y, pi_d)
 
-    A = (beta**2) * V11 + beta * (V12 + V21) + V22
-    B = beta * (V11 @ pi_y + V12 @ pi_d) + (V21 @ pi_y + V22 @ pi_d)
+    A = (beta * beta) * M1 + beta * M2 + M3
+    B = beta * c1 + c2
 
     try:
         pi_hat = np.linalg.solve(A, B)
     except np.linalg.LinAlgError:
-        pi_hat = np.linalg.pinv(A) @ B
+        # B lies in the range of A, so a tiny ridge recovers the minimum-norm
+        # solution without the SVD behind pinv.
+        k_a = A.shape[0]
+        scale = float(np.trace(A)) / k_a
+        ridge = 1e-10 * (scale if scale > 0 else 1.0)
+        pi_hat = np.linalg.solve(A + ridge * np.eye(k_a), B)
 
     r = np.vstack([pi_y - beta * pi_hat, pi_d - pi_hat])
-    q = float((r.T @ V_inv @ r).ravel()[0])
+    q = float(np.vdot(r, V_inv @ r))
+    return pi_hat, r, q
+
+
+def md_optimal_pi_batch(
+    betas: FloatArray,
+    *,
+    V_inv: np.ndarray,
+    k: int,
+    pi_y: np.ndarray,
+    pi_d: np.ndarray,
+    terms: MDTerms | None = None,
+) -> tuple[FloatArray, FloatArray, FloatArray]:
+    """
+    md_optimal_pi over a vector of betas with one stacked solve.
+
+    Returns pi_hat with shape (G, k), r with shape (G, 2k) and q with shape
+    (G,). If the stacked solve hits a singular A(beta), every row falls back
+    to md_optimal_pi.
+    """
+    b = np.asarray(betas, dtype=np.float64).reshape(-1)
+    if terms is None:
+        terms = _md_terms(V_inv, k, pi_y, pi_d)
+    M1, M2, M3, c1, c2 = terms
+    py = pi_y.reshape(-1)
+    pd = pi_d.reshape(-1)
+
+    bb = b[:, None, None]
+    A = (bb * bb) * M1 + bb * M2 + M3
+    B = np.outer(b, c1) + c2.reshape(-1)
+
+    try:
+        pi_hat = cast(FloatArray, np.linalg.solve(A, B[:, :, None])[:, :, 0])
+    except np.linalg.LinAlgError:
+        rows = [
+            md_optimal_pi(
+                float(bi), V_inv=V_inv, k=k, pi_y=pi_y, pi_d=pi_d, terms=terms
+            )
+            for bi in b
+        ]
+        return (
+            np.array([row[0].reshape(-1) for row in rows]),
+            np.array([row[1].reshape(-1) for row in rows]),
+            np.array([row[2] for row in rows]),
+        )
+
+    r = np.hstack([py - b[:, None] * pi_hat, pd - pi_hat])
+    q = np.einsum("gi,gi->g", r @ V_inv, r)
     return pi_hat, r, q
 
 
+@overload
+def chi2_sf(stat: float, df: int) -> float: ...
+
+
+@overload
+def chi2_sf(stat: FloatArray, df: int) -> FloatArray: ...
+
+
+def chi2_sf(stat: float | FloatArray, df: int) -> float | FloatArray:
+    """
+    Chi-square upper tail through the ufunc, bypassing scipy.stats dispatch.
+
+    Negative statistics (round-off in a quadratic form) map to 1.0, matching
+    chi2.sf.
+    """
+    if isinstance(stat, np.ndarray):
+        return np.asarray(chdtrc(df, np.maximum(stat, 0.0)), dtype=np.float64)
+    return float(chdtrc(df, max(stat, 0.0)))
+
+
 def default_beta_bounds(data: IVData) -> tuple[float, float]:
-    y_std = float(np.std(data.y))
-    d_std = float(np.std(data.d))
-    scale = y_std / max(d_std, 1e-12)
+    scale = data.y_std / max(data.d_std, 1e-12)
     width = max(10.0 * scale, 10.0)
     return (-width, width)
@@ -0,0 +1,20 @@
+import sys
+from collections.abc import Iterator
+
+import pytest
+
+try:
+    import matplotlib
+except ImportError:  # pragma: no cover - plotting extra not installed
+    pass
+else:
+    # Headless backend before anything imports pyplot; no GUI toolkit setup.
+    matplotlib.use("Agg", force=True)
+
+
+@pytest.fixture(autouse=True)
+def _close_figures() -> Iterator[None]:
+    yield
+    plt = sys.modules.get("matplotlib.pyplot")
+    if plt is not None:
+        plt.close("all")
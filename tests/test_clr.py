@@ -1,4 +1,21 @@
+import numpy as np
+
 from ivrobust import clr_test, weak_iv_dgp
+from ivrobust.weakiv.clr import (
+    _clr_lambda,
+    _clr_lambdas,
+    _clr_pvalue,
+    _clr_pvalues,
+    _md_q_min_bracketed,
+    _md_q_min_kronecker,
+)
+from ivrobust.weakiv_utils import (
+    default_beta_bounds,
+    md_optimal_pi,
+    md_optimal_pi_batch,
+    proj,
+    reduced_form,
+)
 
 
 def test_clr_method_flag() -> None:
@@ -6,3 +23,148 @@ def test_clr_method_flag() -> None:
     res = clr_test(data, beta0=beta_true, method="CLR", cov_type="HC1")
     assert res.method == "CLR"
     assert 0.0 <= res.pvalue <= 1.0
+
+
+def test_clr_pvalue_upper_tail_stays_positive() -> None:
+    pvals = [_clr_pvalue(stat=s, k=4, lambda1=20.0) for s in (30.0, 80.0, 200.0)]
+    assert all(0.0 < p < 1e-5 for p in pvals)
+    assert pvals[0] > pvals[1] > pvals[2]
+
+
+def test_clr_lambda_matches_projection_formula() -> None:
+    data, _ = weak_iv_dgp(n=200, k=4, strength=0.4, beta=1.0, seed=11)
+    rf = reduced_form(data, cov_type="unadjusted")
+    dof = data.nobs - data.k_instr - data.p_exog
+    for b in (-2.0, 0.0, 1.5):
+        e = rf.y - b * rf.d
+        e_proj = proj(rf.z, e)[0]
+        e_orth = e - e_proj
+        Sigma = (e_orth.T @ rf.d).item() / (e_orth.T @ e_orth).item()
+        d_tilde = rf.d - Sigma * e
+        d_proj = proj(rf.z, d_tilde)[0]
+        d_orth = d_tilde - d_proj
+        expected = dof * (d_proj.T @ d_proj).item() / (d_orth.T @ d_orth).item()
+        got = _clr_lambda(b, rf=rf, p_exog=data.p_exog)
+        assert np.isclose(got, expected, rtol=1e-10)
+
+
+def test_clr_pvalue_limits_in_lambda() -> None:
+    from scipy.stats import chi2
+
+    for stat in (0.5, 3.0, 9.0):
+        strong = _clr_pvalue(stat=stat, k=5, lambda1=1e8, tol=1e-10)
+        weak = _clr_pvalue(stat=stat, k=5, lambda1=1e-8, tol=1e-10)
+        assert np.isclose(strong, chi2.sf(stat, 1), atol=1e-6)
+        assert np.isclose(weak, chi2.sf(stat, 5), atol=1e-6)
+
+
+def test_clr_pvalues_vectorized_matches_scalar() -> None:
+    stats = np.array([0.0, 1e-3, 0.5, 4.0, 25.0, 120.0, 3.0])
+    lambdas = np.array([5.0, 1e5, 0.2, 10.0, 300.0, 2.0, 0.0])
+    for k in (2, 3, 6):
+        got = _clr_pvalues(stats, k=k, lambdas=lambdas, tol=1e-9)
+        expected = [
+            _clr_pvalue(stat=s, k=k, lambda1=lam, tol=1e-9)
+            for s, lam in zip(stats, lambdas, strict=True)
+        ]
+        assert np.allclose(got, expected, atol=1e-7)
+
+
+def test_clr_lambdas_vectorized_matches_scalar() -> None:
+    data, _ = weak_iv_dgp(n=160, k=3, strength=0.5, beta=0.5, seed=2)
+    rf = reduced_form(data, cov_type="unadjusted")
+    betas = np.linspace(-4.0, 4.0, 33)
+    expected = [_clr_lambda(b, rf=rf, p_exog=data.p_exog) for b in betas]
+    got = _clr_lambdas(betas, rf=rf, p_exog=data.p_exog)
+    assert np.allclose(got, expected, rtol=1e-10)
+
+
+def test_md_q_min_closed_form_matches_profiled_search() -> None:
+    from scipy.optimize import minimize_scalar
+
+    data, _ = weak_iv_dgp(n=300, k=4, strength=0.6, beta=1.0, seed=3)
+    rf = reduced_form(data, cov_type="unadjusted")
+    closed = _md_q_min_kronecker(rf, (-10.0, 10.0))
+    assert closed is not None
+
+    def q(b: float) -> float:
+        return md_optimal_pi(
+            b, V_inv=rf.cov_inv, k=rf.k_instr, pi_y=rf.pi_y, pi_d=rf.pi_d
+        )[2]
+
+    res = minimize_scalar(q, bounds=(-10.0, 10.0), method="bounded")
+    assert np.isclose(closed[0], res.x, atol=1e-5)
+    assert np.isclose(closed[1], res.fun, rtol=1e-8)
+    assert closed[1] <= res.fun + 1e-12
+
+
+def test_md_q_min_bracketed_matches_bounded_search() -> None:
+    from scipy.optimize import minimize_scalar
+
+    data, _ = weak_iv_dgp(n=300, k=4, strength=0.45, beta=1.0, seed=2)
+    rf = reduced_form(data, cov_type="HC1")
+    bounds = default_beta_bounds(data)
+    found = _md_q_min_bracketed(rf, bounds)
+    assert found is not None
+
+    def q(b: float) -> float:
+        return md_optimal_pi(
+            b, V_inv=rf.cov_inv, k=rf.k_instr, pi_y=rf.pi_y, pi_d=rf.pi_d
+        )[2]
+
+    res = minimize_scalar(q, bounds=bounds, method="bounded")
+    assert np.isclose(found[0], res.x, atol=1e-5)
+    assert found[1] <= res.fun + 1e-10
+
+
+def test_md_q_min_bracketed_gives_up_on_nonfinite_derivative() -> None:
+    data, _ = weak_iv_dgp(n=200, k=3, strength=0.3, beta=1.0, seed=1)
+    rf = reduced_form(data, cov_type="HC1")
+    with np.errstate(all="ignore"):
+        assert _md_q_min_bracketed(rf, (-1e200, 1e200)) is None
+
+
+def test_md_optimal_pi_batch_matches_scalar() -> None:
+    data, _ = weak_iv_dgp(n=200, k=3, strength=0.4, beta=1.0, seed=8)
+    rf = reduced_form(data, cov_type="HC1")
+    betas = np.array([-4.0, -0.5, 0.0, 1.0, 3.5])
+    pi_hat, r, q = md_optimal_pi_batch(
+        betas, V_inv=rf.cov_inv, k=rf.k_instr, pi_y=rf.pi_y, pi_d=rf.pi_d
+    )
+    for i, b in enumerate(betas):
+        pi_b, r_b, q_b = md_optimal_pi(
+            float(b), V_inv=rf.cov_inv, k=rf.k_instr, pi_y=rf.pi_y, pi_d=rf.pi_d
+        )
+        assert np.allclose(pi_hat[i], pi_b.ravel())
+        assert np.allclose(r[i], r_b.ravel())
+        assert np.isclose(q[i], q_b)
+
+
+def test_md_optimal_pi_cached_terms_match_fresh() -> None:
+    data, _ = weak_iv_dgp(n=200, k=3, strength=0.4, beta=1.0, seed=9)
+    rf = reduced_form(data, cov_type="HC1")
+    for b in (-2.0, 0.3, 4.0):
+        fresh = md_optimal_pi(
+            b, V_inv=rf.cov_inv, k=rf.k_instr, pi_y=rf.pi_y, pi_d=rf.pi_d
+        )
+        cached = md_optimal_pi(
+            b,
+            V_inv=rf.cov_inv,
+            k=rf.k_instr,
+            pi_y=rf.pi_y,
+            pi_d=rf.pi_d,
+            terms=rf.md_terms,
+        )
+        assert np.allclose(fresh[0], cached[0])
+        assert np.isclose(fresh[2], cached[2])
+
+
+def test_md_optimal_pi_singular_system_matches_pinv() -> None:
+    V_inv = np.diag([1.0, 0.0, 1.0, 0.0])
+    pi_y = np.array([[0.7], [0.2]])
+    pi_d = np.array([[0.4], [-0.3]])
+    beta = 1.5
+    pi_hat, _, _ = md_optimal_pi(beta, V_inv=V_inv, k=2, pi_y=pi_y, pi_d=pi_d)
+    A = np.diag([beta**2 + 1.0, 0.0])
+    B = beta * (V_inv[:2, :2] @ pi_y) + V_inv[2:, 2:] @ pi_d
+    assert np.allclose(pi_hat, np.linalg.pinv(A) @ B)
@@ -1,4 +1,10 @@
-from ivrobust import ar_confidence_set, weak_iv_dgp
+import numpy as np
+import pytest
+from scipy.stats import chi2
+
+from ivrobust import ar_confidence_set, ar_test, weak_iv_dgp
+from ivrobust.weakiv.ar import _ARQuadraticForm
+from ivrobust.weakiv_utils import chi2_sf, reduced_form
 
 
 def test_ar_confidence_set_contains_true_beta() -> None:
@@ -7,3 +13,33 @@ def test_ar_confidence_set_contains_true_beta() -> None:
     cs = ar_confidence_set(data, alpha=0.05, cov_type="HC1")
 
     assert cs.confidence_set.contains(beta_true)
+
+
+@pytest.mark.parametrize("cov_type", ["unadjusted", "HC1", "HAC"])
+def test_ar_grid_statistics_match_pointwise(cov_type: str) -> None:
+    data, _ = weak_iv_dgp(n=150, k=3, strength=0.5, beta=1.0, seed=2)
+    betas = np.linspace(-2.0, 3.0, 7)
+
+    rf = reduced_form(data, cov_type=cov_type)
+    batch = _ARQuadraticForm.from_reduced_form(rf).statistics(betas)
+    pointwise = [ar_test(data, beta0=b, cov_type=cov_type).statistic for b in betas]
+
+    assert np.allclose(batch, pointwise, rtol=1e-10, atol=1e-10)
+
+
+def test_chi2_sf_matches_scipy_stats() -> None:
+    stats = np.array([-1e-12, 0.0, 0.5, 3.0, 25.0])
+    np.testing.assert_allclose(chi2_sf(stats, 3), chi2.sf(stats, df=3))
+    assert chi2_sf(-1e-12, 2) == 1.0
+    assert chi2_sf(4.0, 2) == float(chi2.sf(4.0, df=2))
+
+
+def test_reduced_form_cov_blocks_slice_joint_covariance() -> None:
+    data, _ = weak_iv_dgp(n=120, k=3, strength=0.5, beta=1.0, seed=4)
+    rf = reduced_form(data, cov_type="HC1")
+    V_yy, V_cross, V_dd = rf.cov_blocks
+    k = rf.k_instr
+    assert np.array_equal(V_yy, rf.cov[:k, :k])
+    assert np.array_equal(V_dd, rf.cov[k:, k:])
+    assert np.allclose(V_cross, rf.cov[:k, k:] + rf.cov[k:, :k])
+    assert rf.cov_blocks is rf.cov_blocks
@@ -1,7 +1,13 @@
 import numpy as np
 import pytest
 
-from ivrobust.covariance import cov_ols
+from ivrobust.covariance import (
+    _hac_lag_sum,
+    _kernel_weight,
+    compute_moment_cov,
+    cov_ols,
+    cov_reduced_form,
+)
 
 
 def _sample_design() -> tuple[np.ndarray, np.ndarray]:
@@ -87,3 +93,35 @@ def test_cov_ols_cluster_invariance() -> None:
     with pytest.warns(RuntimeWarning):
         res2 = cov_ols(X=x, resid=resid, cov_type="cluster", clusters=clusters2)
     assert np.allclose(res1.cov, res2.cov)
+
+
+@pytest.mark.parametrize("cov_type", ["HC0", "HC1", "HC3", "cluster", "HAC"])
+def test_cov_reduced_form_blocks_match_single_moment(cov_type: str) -> None:
+    rng = np.random.default_rng(3)
+    n, p = 120, 3
+    x = rng.normal(size=(n, p))
+    resid_y = rng.normal(size=n)
+    resid_d = rng.normal(size=n) + 0.5 * resid_y
+    kwargs = {"clusters": rng.integers(0, 20, size=n)} if cov_type == "cluster" else {}
+
+    joint = cov_reduced_form(
+        X=x, resid_y=resid_y, resid_d=resid_d, cov_type=cov_type, **kwargs
+    ).cov
+    for block, resid in ((joint[:p, :p], resid_y), (joint[p:, p:], resid_d)):
+        single = compute_moment_cov(X=x, resid=resid, cov_type=cov_type, **kwargs)
+        assert np.allclose(block, single.cov)
+    assert np.allclose(joint, joint.T)
+
+
+@pytest.mark.parametrize("kernel", ["bartlett", "parzen"])
+def test_hac_fft_lag_sum_matches_direct_sum(kernel: str) -> None:
+    rng = np.random.default_rng(4)
+    U1 = rng.normal(size=(300, 4))
+    U2 = rng.normal(size=(300, 4))
+    lags = 40
+    direct = sum(
+        _kernel_weight(lag, lags, kernel=kernel) * (U1[lag:].T @ U2[:-lag])
+        for lag in range(1, lags + 1)
+    )
+    fast = _hac_lag_sum(U1, U2, lags=lags, kernel=kernel)
+    assert np.allclose(fast, direct, rtol=1e-10, atol=1e-10)
@@ -31,3 +31,25 @@ def test_interval_set_flags() -> None:
     real_line = IntervalSet(intervals=[(-np.inf, np.inf)])
     assert real_line.is_real_line
     assert real_line.is_unbounded
+
+
+def test_interval_set_endpoints() -> None:
+    cs = IntervalSet(intervals=[(-1.0, 0.0), (2.0, np.inf)])
+    assert cs.endpoints.shape == (2, 2)
+    assert np.array_equal(cs.endpoints[:, 0], [-1.0, 2.0])
+    assert cs.is_unbounded
+    assert IntervalSet(intervals=[]).endpoints.shape == (0, 2)
+    assert not IntervalSet(intervals=[(0.0, 1.0)]).is_unbounded
+
+
+def test_interval_set_contains() -> None:
+    cs = IntervalSet(intervals=[(-np.inf, -1.0), (0.0, 1.0)])
+    assert cs.contains(-5.0)
+    assert cs.contains(1.0)
+    assert not cs.contains(-0.5)
+    assert not IntervalSet(intervals=[]).contains(0.0)
+
+
+def test_interval_set_normalized_sorts_unordered_input() -> None:
+    cs = IntervalSet(intervals=[(3.0, 4.0), (-1.0, 0.5), (0.0, 1.0)])
+    assert cs.normalized().intervals == [(-1.0, 1.0), (3.0, 4.0)]
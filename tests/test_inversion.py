@@ -1,5 +1,6 @@
 import numpy as np
 
+from ivrobust.intervals import invert_pvalue_grid
 from ivrobust.weakiv.inversion import GridSpec, InversionSpec, invert_test
 
 
@@ -40,3 +41,70 @@ def test_inversion_unbounded_interval() -> None:
     cs, _ = invert_test(test_fn=pval, alpha=0.5, grid_spec=grid_spec, inversion_spec=inv_spec)
     assert cs.intervals[0][0] == float("-inf")
     assert cs.intervals[0][1] == float("inf")
+
+
+def test_inversion_unrefined_interpolates_crossings() -> None:
+    grid_spec = GridSpec(beta_bounds=(-2.0, 2.0), n_grid=301)
+    inv_spec = InversionSpec(refine=False)
+
+    def pval(b: float) -> float:
+        return max(0.0, 1.0 - abs(b))
+
+    cs, _ = invert_test(test_fn=pval, alpha=0.5, grid_spec=grid_spec, inversion_spec=inv_spec)
+    lo, hi = cs.intervals[0]
+    assert np.isclose(lo, -0.5)
+    assert np.isclose(hi, 0.5)
+
+
+def test_inversion_refinement_uses_few_evaluations() -> None:
+    grid_spec = GridSpec(beta_bounds=(-3.0, 3.0), n_grid=301)
+    inv_spec = InversionSpec(refine=True, refine_tol=1e-12)
+    calls = [0]
+
+    def pval(b: float) -> float:
+        calls[0] += 1
+        return float(np.exp(-b * b))
+
+    cs, _ = invert_test(test_fn=pval, alpha=0.5, grid_spec=grid_spec, inversion_spec=inv_spec)
+    lo, hi = cs.intervals[0]
+    root = float(np.sqrt(np.log(2.0)))
+    assert np.isclose(lo, -root, atol=1e-9)
+    assert np.isclose(hi, root, atol=1e-9)
+    assert calls[0] - grid_spec.n_grid < 30
+
+
+def test_pvalue_grid_single_point_runs() -> None:
+    grid = np.arange(6, dtype=float)
+    pvals = np.array([1.0, 0.0, 1.0, 0.0, 0.0, 1.0])
+    cs = invert_pvalue_grid(
+        grid=grid,
+        pvalues=pvals,
+        alpha=0.5,
+        refine=False,
+        refine_tol=1e-6,
+        max_refine_iter=10,
+        pvalue_func=None,
+    )
+    assert cs.intervals == [(float("-inf"), 0.5), (1.5, 2.5), (4.5, float("inf"))]
+
+
+def test_adaptive_grid_matches_full_scan_with_fewer_evaluations() -> None:
+    def pval(b: float) -> float:
+        return float(np.exp(-4.0 * (b - 1.5) ** 2) + 0.8 * np.exp(-9.0 * (b + 2.0) ** 2))
+
+    inv_spec = InversionSpec(refine=True, refine_tol=1e-10)
+    full, _ = invert_test(
+        test_fn=pval,
+        alpha=0.3,
+        grid_spec=GridSpec(beta_bounds=(-6.0, 6.0), n_grid=2001),
+        inversion_spec=inv_spec,
+    )
+    adaptive, info = invert_test(
+        test_fn=pval,
+        alpha=0.3,
+        grid_spec=GridSpec(beta_bounds=(-6.0, 6.0), n_grid=2001, adaptive=True),
+        inversion_spec=inv_spec,
+    )
+    assert len(adaptive.intervals) == 2
+    assert np.allclose(adaptive.endpoints, full.endpoints, atol=1e-8)
+    assert info["evaluations"] < 1000
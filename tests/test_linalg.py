@@ -2,7 +2,15 @@ from pathlib import Path
 
 import numpy as np
 
-from ivrobust.linalg.ops import proj, resid
+from ivrobust.linalg.ops import (
+    orth_basis,
+    proj,
+    proj_many,
+    resid,
+    resid_many,
+    sym_solve,
+)
+from ivrobust.weakiv_utils import partial_out
 
 
 def test_projection_idempotence() -> None:
@@ -43,3 +51,50 @@ def test_no_explicit_inv_in_core() -> None:
     for path in files:
         text = path.read_text(encoding="utf-8")
         assert "np.linalg.inv" not in text
+
+
+def test_sym_solve_cholesky_and_fallback() -> None:
+    rng = np.random.default_rng(3)
+    M = rng.standard_normal((5, 5))
+    A = M @ M.T + np.eye(5)
+    b = rng.standard_normal(5)
+    assert np.allclose(sym_solve(A, b).ravel(), np.linalg.solve(A, b))
+
+    indefinite = np.diag([2.0, -1.0])
+    assert np.allclose(sym_solve(indefinite, np.ones(2)).ravel(), [0.5, -1.0])
+
+
+def test_shared_basis_partial_out_matches_per_array_resid() -> None:
+    rng = np.random.default_rng(5)
+    X = rng.standard_normal((60, 4))
+    y = rng.standard_normal(60)
+    Z = rng.standard_normal((60, 3))
+
+    q = orth_basis(X)
+    assert np.allclose(q.T @ q, np.eye(4))
+    y_t, Z_t = partial_out(X, y, Z)
+    assert np.allclose(y_t, resid(X, y))
+    assert np.allclose(Z_t, resid(X, Z))
+
+
+def test_intercept_partial_out_matches_qr_residual() -> None:
+    rng = np.random.default_rng(3)
+    x = np.full((40, 1), 2.0)
+    a = rng.standard_normal((40, 2))
+    z = rng.standard_normal(40)
+    a_t, z_t = partial_out(x, a, z)
+    q = orth_basis(x)
+    assert np.allclose(a_t, a - q @ (q.T @ a))
+    assert np.allclose(z_t, z.reshape(-1, 1) - q @ (q.T @ z.reshape(-1, 1)))
+
+
+def test_many_helpers_match_single_array_versions() -> None:
+    rng = np.random.default_rng(5)
+    X = rng.standard_normal((30, 3))
+    a = rng.standard_normal((30, 2))
+    b = rng.standard_normal(30)
+    for many, single in ((resid_many, resid), (proj_many, proj)):
+        out_a, out_b = many(X, a, b)
+        assert np.allclose(out_a, single(X, a))
+        assert np.allclose(out_b, single(X, b))
+        assert out_b.shape == (30, 1)
@@ -1,5 +1,8 @@
+import numpy as np
+import pytest
 
-from ivrobust import kp_rank_test, lm_test, weak_iv_dgp
+from ivrobust import kp_rank_test, lm_confidence_set, lm_test, weak_iv_dgp
+from ivrobust.weakiv_utils import proj, reduced_form
 
 
 def test_kp_rank_stat_runs() -> None:
@@ -15,3 +18,54 @@ def test_lm_test_nonnegative() -> None:
     res = lm_test(data, beta0=beta_true, cov_type="HC1")
     assert res.statistic >= 0.0
     assert 0.0 <= res.pvalue <= 1.0
+
+
+def test_reduced_form_gram_matches_projection() -> None:
+    data, _ = weak_iv_dgp(n=150, k=3, strength=0.4, beta=1.0, seed=5)
+    rf = reduced_form(data, cov_type="unadjusted")
+    yd = np.hstack([rf.y, rf.d])
+    fitted = proj(rf.z, yd)[0]
+
+    F, R = rf.gram
+    assert np.allclose(F, fitted.T @ fitted)
+    assert np.allclose(R, (yd - fitted).T @ (yd - fitted))
+
+
+@pytest.mark.parametrize("cov_type", ["HC1", "unadjusted"])
+def test_lm_confidence_set_endpoints_match_lm_test(cov_type: str) -> None:
+    data, _ = weak_iv_dgp(n=250, k=3, strength=0.6, beta=1.0, seed=8)
+    cs = lm_confidence_set(data, alpha=0.1, cov_type=cov_type)
+    finite = cs.confidence_set.endpoints[np.isfinite(cs.confidence_set.endpoints)]
+    assert finite.size > 0
+    for b in finite:
+        assert np.isclose(
+            lm_test(data, beta0=b, cov_type=cov_type).pvalue, 0.1, atol=1e-4
+        )
+
+
+def test_lm_grid_statistics_match_pointwise() -> None:
+    from ivrobust.weakiv.lm import _lm_statistic, _lm_statistics
+
+    data, _ = weak_iv_dgp(n=180, k=4, strength=0.3, beta=1.0, seed=6)
+    rf = reduced_form(data, cov_type="unadjusted")
+    betas = np.linspace(-5.0, 5.0, 41)
+    expected = [
+        _lm_statistic(b, rf=rf, homoskedastic=True, p_exog=data.p_exog, warnings=[])
+        for b in betas
+    ]
+    got = _lm_statistics(betas, rf=rf, p_exog=data.p_exog)
+    assert np.allclose(got, expected, rtol=1e-10, atol=1e-12)
+
+
+def test_lm_md_grid_statistics_match_pointwise() -> None:
+    from ivrobust.weakiv.lm import _lm_md_statistics, _lm_statistic
+
+    data, _ = weak_iv_dgp(n=180, k=4, strength=0.3, beta=1.0, seed=6)
+    rf = reduced_form(data, cov_type="HC1")
+    betas = np.linspace(-5.0, 5.0, 41)
+    expected = [
+        _lm_statistic(b, rf=rf, homoskedastic=False, p_exog=data.p_exog, warnings=[])
+        for b in betas
+    ]
+    got = _lm_md_statistics(betas, rf=rf)
+    assert np.allclose(got, expected, rtol=1e-8, atol=1e-10)
@@ -1,57 +1,101 @@
 from pathlib import Path
 
 import numpy as np
+import pytest
 
 import ivrobust as ivr
-from ivrobust import ConfidenceSetResult, IntervalSet
+from ivrobust import ConfidenceSetResult, IntervalSet, WeakIVInferenceResult
 from ivrobust.plot_style import style_context
 
+mpl = pytest.importorskip("matplotlib")
+plt = pytest.importorskip("matplotlib.pyplot")
 
-def test_plot_ar_confidence_set_branches() -> None:
-    grid = np.linspace(-1.0, 1.0, 5).reshape(-1, 1)
+_GRID = np.linspace(-1.0, 1.0, 5).reshape(-1, 1)
+_CS_EMPTY = ConfidenceSetResult(
+    confidence_set=IntervalSet(intervals=[]),
+    alpha=0.05,
+    method="AR",
+    grid_info={"grid": _GRID, "df": 1, "cov_type": "HC1"},
+)
+_CS_NONEMPTY = ConfidenceSetResult(
+    confidence_set=IntervalSet(intervals=[(-0.5, 0.5)]),
+    alpha=0.05,
+    method="AR",
+    grid_info={"grid": _GRID, "df": 1, "cov_type": "HC1"},
+)
 
-    cs_empty = ConfidenceSetResult(
-        confidence_set=IntervalSet(intervals=[]),
-        alpha=0.05,
-        method="AR",
-        grid_info={"grid": grid, "df": 1, "cov_type": "HC1"},
-    )
-    fig, ax = ivr.plot_ar_confidence_set(cs_empty)
+
+def test_plot_ar_confidence_set_branches() -> None:
+    _fig, ax = ivr.plot_ar_confidence_set(_CS_EMPTY)
     assert ax.axison is False
 
-    cs_nonempty = ConfidenceSetResult(
-        confidence_set=IntervalSet(intervals=[(-0.5, 0.5)]),
-        alpha=0.05,
-        method="AR",
-        grid_info={"grid": grid, "df": 1, "cov_type": "HC1"},
-    )
-    fig2, ax2 = ivr.plot_ar_confidence_set(cs_nonempty)
+    _fig2, ax2 = ivr.plot_ar_confidence_set(_CS_NONEMPTY)
     assert ax2.get_xlabel() == r"$\beta$"
 
-    import matplotlib.pyplot as plt
-
-    plt.close(fig)
-    plt.close(fig2)
-
 
 def test_savefig_writes_files(tmp_path: Path) -> None:
     ivr.set_style()
-    import matplotlib.pyplot as plt
+    fig, ax = plt.subplots()
+    ax.plot([0, 1], [0, 1])
+
+    # One low-resolution raster exercises the real writer; the format loop
+    # is covered without rendering in the test below.
+    paths = ivr.savefig(fig, tmp_path / "fig", formats=("png",), dpi=50)
 
+    assert [path.suffix for path in paths] == [".png"]
+    assert paths[0].exists()
+
+
+def test_savefig_dispatches_each_format(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
     fig, ax = plt.subplots()
     ax.plot([0, 1], [0, 1])
+    calls: list[tuple[Path, dict[str, object]]] = []
+    monkeypatch.setattr(
+        fig, "savefig", lambda out, **kwargs: calls.append((out, kwargs))
+    )
 
-    out = tmp_path / "fig"
-    paths = ivr.savefig(fig, out, formats=("png", "pdf"))
+    paths = ivr.savefig(fig, tmp_path / "fig", formats=("png", ".PDF"), dpi=72)
 
-    for path in paths:
-        assert path.exists()
+    assert paths == [tmp_path / "fig.png", tmp_path / "fig.pdf"]
+    assert [out for out, _ in calls] == paths
+    assert calls[0][1]["dpi"] == 72
+    assert "dpi" not in calls[1][1]
 
 
 def test_style_context_restores_rcparams() -> None:
-    import matplotlib as mpl
-
     original = mpl.rcParams["axes.facecolor"]
     with style_context():
         assert mpl.rcParams["axes.facecolor"] == "white"
     assert mpl.rcParams["axes.facecolor"] == original
+
+
+def test_weakiv_plot_shared_grid_labels() -> None:
+    grid = np.linspace(-1.0, 1.0, 5)
+    sets = {
+        name: ConfidenceSetResult(
+            confidence_set=IntervalSet(intervals=[(-0.5, 0.5)]),
+            alpha=0.05,
+            method=name,
+            grid_info={"grid": grid, "pvalues": np.linspace(0.0, 1.0, 5)},
+        )
+        for name in ("AR", "LM")
+    }
+    res = WeakIVInferenceResult(
+        tests={}, confidence_sets=sets, recommended="AR", alpha=0.05, cov_type="HC1"
+    )
+    _fig, ax = res.plot()
+    labels = [line.get_label() for line in ax.get_lines()]
+    assert labels[:2] == ["AR", "LM"]
+
+
+def test_plot_ar_confidence_set_title() -> None:
+    cs = ConfidenceSetResult(
+        confidence_set=IntervalSet(intervals=[(-0.5, 0.5)]),
+        alpha=0.05,
+        method="LM",
+        grid_info={"df": 3, "cov_type": "HC1"},
+    )
+    _fig, ax = ivr.plot_ar_confidence_set(cs)
+    assert ax.get_title() == "AR 95% confidence set (df=3, HC1)"
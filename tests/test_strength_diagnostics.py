@@ -1,6 +1,15 @@
 import numpy as np
+import pytest
 
-from ivrobust import stock_yogo_critical_values, weak_id_diagnostics, weak_iv_dgp
+from ivrobust import (
+    effective_f,
+    first_stage_diagnostics,
+    kp_rank_test,
+    stock_yogo_critical_values,
+    weak_id_diagnostics,
+    weak_iv_dgp,
+)
+from ivrobust.weakiv_utils import reduced_form
 
 
 def test_weak_id_diagnostics_fields() -> None:
@@ -14,5 +23,40 @@ def test_weak_id_diagnostics_fields() -> None:
 
 
 def test_stock_yogo_table() -> None:
-    val = stock_yogo_critical_values(1, 3, size_distortion=0.10)
-    assert np.isfinite(val)
+    vals = np.array(
+        [stock_yogo_critical_values(1, k, size_distortion=0.10) for k in range(1, 11)]
+    )
+    assert np.isfinite(vals).all()
+    # More instruments need a smaller F for the same size distortion.
+    assert np.all(np.diff(vals) < 0)
+    assert vals[2] == 7.25
+    with pytest.raises(NotImplementedError, match="k_instr"):
+        stock_yogo_critical_values(1, 11)
+
+
+def test_weak_id_diagnostics_accepts_reduced_form() -> None:
+    data, _ = weak_iv_dgp(n=220, k=4, strength=0.5, beta=1.0, seed=7)
+    rf = reduced_form(data, cov_type="HC1")
+    direct = weak_id_diagnostics(data, cov_type="HC1")
+    shared = weak_id_diagnostics(data, cov_type="HC1", rf=rf)
+    assert shared.effective_f == pytest.approx(direct.effective_f)
+    assert shared.kp_rk_stat == pytest.approx(direct.kp_rk_stat)
+    assert shared.cragg_donald_f == pytest.approx(direct.first_stage_f)
+
+
+def test_first_stage_pvalue_matches_f_distribution() -> None:
+    from scipy.stats import f
+
+    data, _ = weak_iv_dgp(n=150, k=3, strength=0.3, beta=1.0, seed=4)
+    diag = first_stage_diagnostics(data)
+    expected = f.sf(diag.f_statistic, diag.df_num, diag.df_denom)
+    assert np.isclose(diag.pvalue, expected, rtol=1e-10)
+
+
+def test_first_stage_wald_shared_across_diagnostics() -> None:
+    data, _ = weak_iv_dgp(n=200, k=4, strength=0.5, beta=1.0, seed=12)
+    rf = reduced_form(data, cov_type="HC1")
+    eff = effective_f(data, rf=rf)
+    rk = kp_rank_test(data, rf=rf)
+    assert np.isclose(eff.statistic * data.k_instr, rf.first_stage_wald)
+    assert rk.statistic == rf.first_stage_wald
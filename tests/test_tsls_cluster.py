@@ -7,9 +7,7 @@ from ivrobust import IVData, tsls, weak_iv_dgp
 def test_tsls_cluster_covariance_runs() -> None:
     data, _ = weak_iv_dgp(n=240, k=3, strength=0.6, beta=1.0, seed=2)
     n_clusters = 12
-    clusters = np.repeat(np.arange(n_clusters), np.ceil(data.nobs / n_clusters))[
-        : data.nobs
-    ]
+    clusters = np.arange(data.nobs) * n_clusters // data.nobs
     data = data.with_clusters(clusters)
 
     res = tsls(data, cov_type="cluster")
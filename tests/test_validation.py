@@ -2,6 +2,7 @@ import numpy as np
 import pytest
 
 from ivrobust import IVData
+from ivrobust._validation import _as_scalar_float
 
 
 def test_ivdata_rejects_nan() -> None:
@@ -20,3 +21,38 @@ def test_ivdata_requires_consistent_rows() -> None:
     z = np.ones((3, 1))
     with pytest.raises(ValueError, match="same number of rows"):
         IVData(y=y, d=d, x=x, z=z)
+
+
+def test_ivdata_accepts_large_finite_values() -> None:
+    y = np.array([1e308, 1e308, 2.0]).reshape(-1, 1)
+    d = np.array([1.0, 2.0, 4.0]).reshape(-1, 1)
+    x = np.ones((3, 1))
+    z = np.array([0.5, -1.0, 2.0]).reshape(-1, 1)
+    data = IVData(y=y, d=d, x=x, z=z)
+    assert data.nobs == 3
+
+
+def test_ivdata_rejects_inf() -> None:
+    y = np.ones((3, 1))
+    d = np.array([1.0, np.inf, 2.0]).reshape(-1, 1)
+    x = np.ones((3, 1))
+    z = np.ones((3, 1))
+    with pytest.raises(ValueError, match="infinite"):
+        IVData(y=y, d=d, x=x, z=z)
+
+
+@pytest.mark.parametrize("value", [1.5, np.float64(1.5), [1.5], np.array([[1.5]])])
+def test_as_scalar_float_accepts_numbers_and_arrays(value: object) -> None:
+    out = _as_scalar_float(value)  # type: ignore[arg-type]
+    assert type(out) is float
+    assert out == 1.5
+
+
+def test_ivdata_caches_outcome_and_endog_scale() -> None:
+    rng = np.random.default_rng(0)
+    y = rng.normal(scale=3.0, size=(50, 1))
+    d = rng.normal(scale=0.5, size=(50, 1))
+    data = IVData(y=y, d=d, x=np.ones((50, 1)), z=rng.normal(size=(50, 2)))
+    assert data.y_std == pytest.approx(float(np.std(y)))
+    assert data.d_std == pytest.approx(float(np.std(d)))
+    assert "y_std" in vars(data)
@@ -0,0 +1,14 @@
+import warnings
+
+from ivrobust.utils.warnings import IVRobustWarning, WarningCategory, warn
+
+
+def test_warn_repeats_are_left_to_warning_filters() -> None:
+    with warnings.catch_warnings(record=True) as record:
+        warnings.simplefilter("always")
+        warn(WarningCategory.WEAK_ID, "repeat check")
+        warn(WarningCategory.WEAK_ID, "repeat check")
+
+    hits = [w for w in record if issubclass(w.category, IVRobustWarning)]
+    assert len(hits) == 2
+    assert str(hits[0].message) == "weak_id: repeat check"
@@ -1,4 +1,9 @@
-from ivrobust import weak_iv_dgp, weakiv_inference
+from collections.abc import Callable
+
+import pytest
+
+from ivrobust import ar_test, clr_test, lm_test, results, weak_iv_dgp, weakiv_inference
+from ivrobust.weakiv_utils import reduced_form
 
 
 def test_weakiv_inference_returns_results() -> None:
@@ -16,3 +21,54 @@ def test_weakiv_inference_returns_results() -> None:
     assert "LM" in res.tests
     assert "AR" in res.confidence_sets
     assert res.confidence_sets["AR"].confidence_set.contains(beta_true)
+
+
+def test_weakiv_inference_as_dict_shallow() -> None:
+    data, beta_true = weak_iv_dgp(n=120, k=2, strength=0.8, beta=1.0, seed=5)
+    res = weakiv_inference(data, beta0=beta_true, methods=("AR",))
+
+    shallow = res.as_dict(deep=False)
+    assert shallow["tests"]["AR"]["details"] is res.tests["AR"].details
+    deep = res.as_dict()
+    assert deep["tests"]["AR"]["details"] is not res.tests["AR"].details
+    assert deep["tests"]["AR"]["details"] == res.tests["AR"].details
+
+
+def test_results_to_latex_without_pandas() -> None:
+    data, _ = weak_iv_dgp(n=120, k=2, strength=0.8, beta=1.0, seed=5)
+    res = weakiv_inference(data, beta0=1.0, methods=("AR",))
+
+    latex = res.tests["AR"].to_latex()
+    assert latex.startswith("\\begin{tabular}{rrrllr}")
+    assert "cov\\_type" in latex
+    assert "\\end{tabular}" in latex
+
+    cs_latex = res.confidence_sets["AR"].to_latex()
+    assert cs_latex.count("\\\\") == 1 + len(res.confidence_sets["AR"].intervals)
+
+
+@pytest.mark.parametrize("test_fn", [ar_test, lm_test, clr_test])
+def test_precomputed_reduced_form_matches(
+    test_fn: Callable[..., results.TestResult],
+) -> None:
+    data, _ = weak_iv_dgp(n=200, k=3, strength=0.5, beta=1.0, seed=5)
+    rf = reduced_form(data, cov_type="HC1")
+
+    direct = test_fn(data, beta0=0.5, cov_type="HC1")
+    shared = test_fn(data, beta0=0.5, cov_type="HC1", rf=rf)
+    assert shared.statistic == pytest.approx(direct.statistic)
+    assert shared.pvalue == pytest.approx(direct.pvalue)
+
+
+def test_weakiv_inference_parallel_matches_serial() -> None:
+    data, _ = weak_iv_dgp(n=200, k=3, strength=0.6, beta=1.0, seed=11)
+
+    serial = weakiv_inference(data, beta0=1.0, parallel=False)
+    threaded = weakiv_inference(data, beta0=1.0, parallel=True)
+
+    assert list(threaded.tests) == list(serial.tests)
+    for name, cs in serial.confidence_sets.items():
+        assert threaded.tests[name].pvalue == serial.tests[name].pvalue
+        assert threaded.confidence_sets[name].confidence_set.intervals == (
+            cs.confidence_set.intervals
+        )